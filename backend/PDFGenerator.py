@@ -9,6 +9,12 @@ from datetime import datetime
 import json
 from typing import List, Dict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class weeklyRoundupPDF:
     def __init__(self):
         """Initialize PDF generator with styling"""
@@ -68,8 +74,12 @@ class weeklyRoundupPDF:
         
         # Load JSON data
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                summaries = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(json_file, 'rb') as f:
+                    summaries = orjson.loads(f.read())
+            else:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    summaries = json.load(f)
         except Exception as e:
             print(f"Error loading JSON file: {e}")
             return None
@@ -3,22 +3,65 @@ Article Relevance Checker
 Test individual article URLs to check their relevance scores
 """
 
-from testCollector import CustomArticleCollector, ArticleCandidate
-from newspaper import Article
+from testCollector import CustomArticleCollector, ArticleCandidate, ParsedArticle, parse_article
+from output_utils import emit_lines
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
+import html
+import multiprocessing
+import os
+import queue
+import re
 import sys
+import threading
 
-def check_article_relevance(url: str):
+# Max URLs processed concurrently in batch mode
+BATCH_MAX_WORKERS = 16
+
+_BAR70 = "=" * 70
+
+# Raw <title> tag - enough for the Stage 1 title check without a full parse
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.I)
+
+# Title+URL score below this means no keyword at all
+TITLE_SKIP_CUTOFF = 0.5
+
+
+def raw_title(page: str) -> str:
+    """Text of the page's <title> tag via regex, or '' if there isn't one"""
+    m = _TITLE_RE.search(page)
+    return html.unescape(m.group(1)).strip() if m else ""
+
+
+def title_is_irrelevant(collector: CustomArticleCollector, page: str, url: str) -> bool:
+    """
+    True when the page has a <title> and neither it nor the URL contains a
+    single keyword - the collector would drop it at Stage 1, so there is
+    no point parsing and scoring the full content
+    """
+    title = raw_title(page)
+    if not title:
+        return False
+    title_score, _ = collector.calculate_title_relevance_score(title, url)
+    return title_score < TITLE_SKIP_CUTOFF
+
+
+def check_article_relevance(url: str, collector: CustomArticleCollector = None):
     """
     Check the relevance score of a single article
+    
+    Pass an existing collector to reuse its session (connection pool,
+    keep-alive) across checks instead of building a new one per URL.
     """
-    print("=" * 70)
+    print(_BAR70)
     print("ARTICLE RELEVANCE CHECKER")
-    print("=" * 70)
+    print(_BAR70)
     print(f"\nChecking: {url}\n")
     
-    # Initialize collector
-    collector = CustomArticleCollector()
+    # Initialize collector (only if the caller didn't provide one)
+    if collector is None:
+        collector = CustomArticleCollector()
     
     try:
         # Download and parse article
@@ -29,10 +72,12 @@ def check_article_relevance(url: str):
             print(f"❌ Failed to download: HTTP {response.status_code}")
             return
         
-        article = Article(url)
-        article.download_state = 2
-        article.html = response.text
-        article.parse()
+        if title_is_irrelevant(collector, response.text, url):
+            print(f"⏭️  SKIP: title irrelevant - no keywords in \"{raw_title(response.text)}\" or the URL")
+            print("   (the collector would drop it at Stage 1, so the content is not parsed)")
+            return
+        
+        article = parse_article(url, response.text)
         
         if not article.text or len(article.text) < 100:
             print("❌ Insufficient content extracted")
@@ -51,16 +96,19 @@ def check_article_relevance(url: str):
         print(f"   Title Score: {title_score:.1f}")
         print(f"   Keywords in title: {', '.join(title_keywords) if title_keywords else 'None'}\n")
         
+        # Steps 3 and 4 share one pass over the content
+        analysis = collector.analyze(title, article.text)
+        content_score, content_keywords = analysis.score, analysis.keywords
+        is_relevant = analysis.is_luxury
+        
         # Step 3: Content relevance score
         print("Step 3: Checking full content relevance...")
-        content_score, content_keywords = collector.calculate_relevance_score(title, article.text)
         print(f"   Content Score: {content_score:.1f}")
         print(f"   Keywords in content: {', '.join(content_keywords[:10])}{'...' if len(content_keywords) > 10 else ''}")
         print(f"   Total keywords found: {len(content_keywords)}\n")
         
         # Step 4: Luxury content validation
         print("Step 4: Validating luxury/jewelry relevance...")
-        is_relevant = collector.is_luxury_relevant_content(title, article.text)
         print(f"   Passes luxury validation: {'✅ YES' if is_relevant else '❌ NO'}\n")
         
         # Step 5: Extract author
@@ -69,36 +117,36 @@ def check_article_relevance(url: str):
         print(f"   Author: {author}\n")
         
         # Final verdict
-        print("=" * 70)
-        print("FINAL VERDICT")
-        print("=" * 70)
-        
         threshold = 3.0
+        out = [_BAR70, "FINAL VERDICT", _BAR70]
         
         if content_score > threshold and is_relevant:
-            print(f"✅ WOULD BE COLLECTED")
-            print(f"   Content score ({content_score:.1f}) > threshold ({threshold})")
-            print(f"   Passes luxury validation: YES")
+            out.append("✅ WOULD BE COLLECTED")
+            out.append(f"   Content score ({content_score:.1f}) > threshold ({threshold})")
+            out.append("   Passes luxury validation: YES")
         elif content_score > threshold:
-            print(f"⚠️  WOULD BE REJECTED (fails luxury validation)")
-            print(f"   Content score ({content_score:.1f}) > threshold ({threshold})")
-            print(f"   Passes luxury validation: NO")
+            out.append("⚠️  WOULD BE REJECTED (fails luxury validation)")
+            out.append(f"   Content score ({content_score:.1f}) > threshold ({threshold})")
+            out.append("   Passes luxury validation: NO")
         elif is_relevant:
-            print(f"⚠️  WOULD BE REJECTED (score too low)")
-            print(f"   Content score ({content_score:.1f}) <= threshold ({threshold})")
-            print(f"   Passes luxury validation: YES")
+            out.append("⚠️  WOULD BE REJECTED (score too low)")
+            out.append(f"   Content score ({content_score:.1f}) <= threshold ({threshold})")
+            out.append("   Passes luxury validation: YES")
         else:
-            print(f"❌ WOULD BE REJECTED")
-            print(f"   Content score ({content_score:.1f}) <= threshold ({threshold})")
-            print(f"   Passes luxury validation: NO")
-        
-        print("\nArticle Details:")
-        print(f"   Title: {title}")
-        print(f"   Author: {author}")
-        print(f"   URL: {url}")
-        print(f"   Content Score: {content_score:.1f}")
-        print(f"   Keywords: {', '.join(content_keywords[:15])}")
-        print("=" * 70)
+            out.append("❌ WOULD BE REJECTED")
+            out.append(f"   Content score ({content_score:.1f}) <= threshold ({threshold})")
+            out.append("   Passes luxury validation: NO")
+        
+        out += [
+            "\nArticle Details:",
+            f"   Title: {title}",
+            f"   Author: {author}",
+            f"   URL: {url}",
+            f"   Content Score: {content_score:.1f}",
+            f"   Keywords: {', '.join(content_keywords[:15])}",
+            _BAR70,
+        ]
+        emit_lines(out)
         
     except Exception as e:
         print(f"\n❌ Error checking article: {str(e)}")
@@ -110,16 +158,38 @@ def interactive_mode():
     """
     Interactive mode - keep checking URLs
     """
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print("INTERACTIVE ARTICLE RELEVANCE CHECKER")
-    print("=" * 70)
+    print(_BAR70)
     print("\nCheck multiple article URLs to see their relevance scores")
     print("Type 'quit' or 'exit' to stop\n")
     
+    collector = CustomArticleCollector()
+    
+    # Checks run on a background worker so the next URL can be typed
+    # while the previous one is still downloading
+    pending = queue.Queue()
+    
+    def worker():
+        while True:
+            url = pending.get()
+            if url is None:
+                break
+            print()
+            check_article_relevance(url, collector)
+            print()
+    
+    worker_thread = threading.Thread(target=worker, daemon=True)
+    worker_thread.start()
+    
     while True:
         url = input("\nEnter article URL (or 'quit' to exit): ").strip()
         
         if url.lower() in ['quit', 'exit', 'q']:
+            if not pending.empty():
+                print("\nFinishing queued checks...")
+            pending.put(None)
+            worker_thread.join()
             print("\nGoodbye!")
             break
         
@@ -130,71 +200,182 @@ def interactive_mode():
             print("❌ Invalid URL - must start with http:// or https://")
             continue
         
-        print()
-        check_article_relevance(url)
-        print()
+        pending.put(url)
+        print(f"⏳ Queued: {url}")
+
+
+class DomainLocks:
+    """
+    One lock per domain, so a batch never has two requests in flight to
+    the same publication
+    """
+
+    def __init__(self):
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, url: str) -> threading.Lock:
+        domain = urlparse(url).netloc.lower()
+        with self._guard:
+            return self._locks.setdefault(domain, threading.Lock())
+
+
+def _parse_worker(url: str, html: str) -> tuple:
+    """
+    Process-pool worker: parse one page and return only primitives
+    (title, text, authors, meta_description) so IPC stays cheap
+    """
+    article = parse_article(url, html)
+    return (
+        article.title or "",
+        article.text or "",
+        list(article.authors or []),
+        getattr(article, "meta_description", "") or "",
+    )
+
+
+_warmup_barrier = None
+
+
+def _init_parse_worker(barrier):
+    """Pool initializer: keep the warm-up barrier (inherited through fork)"""
+    global _warmup_barrier
+    _warmup_barrier = barrier
+
+
+def _warm_up_worker():
+    """Block until every pool worker is running one of these"""
+    try:
+        _warmup_barrier.wait(timeout=30)
+    except threading.BrokenBarrierError:
+        pass
+
+
+def create_parse_pool(n_urls: int) -> ProcessPoolExecutor:
+    """
+    Process pool for HTML parsing, so pages parse on all cores instead of
+    queueing behind the GIL. Uses fork where available (Linux) so workers
+    inherit the already-imported parsers.
+    """
+    max_workers = max(1, min(os.cpu_count() or 1, n_urls))
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        barrier = context.Barrier(max_workers)
+        pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                   initializer=_init_parse_worker, initargs=(barrier,))
+        # Fork every worker now, before any download threads exist. Before
+        # Python 3.11 workers are otherwise started on demand; warm-up tasks
+        # that wait for each other keep all workers busy, so each submit
+        # has to start a new one.
+        warm_up = [pool.submit(_warm_up_worker) for _ in range(max_workers)]
+        for future in warm_up:
+            future.result()
+        return pool
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def _process_one(url: str, collector: CustomArticleCollector, parse_pool: ProcessPoolExecutor,
+                 domain_locks: DomainLocks) -> tuple:
+    """
+    Download, parse and score one batch URL.
+    Returns (status line or None, result dict or None)
+    """
+    try:
+        with domain_locks(url):
+            response = collector.make_request(url, timeout=20)
+        
+        if title_is_irrelevant(collector, response.text, url):
+            title = raw_title(response.text)
+            result = {
+                'url': url,
+                'title': title,
+                'author': 'Unknown',
+                'score': 0.0,
+                'keywords': 0,
+                'passes': False
+            }
+            return f"   ⏭️  SKIP: title irrelevant | {title[:50]}...", result
+        
+        # Parsing is CPU-bound, so it runs in the process pool
+        title, text, authors, meta_description = parse_pool.submit(_parse_worker, url, response.text).result()
+        article = ParsedArticle(
+            url=url,
+            html=response.text,
+            title=title,
+            text=text,
+            authors=authors,
+            meta_description=meta_description,
+        )
+        
+        if not article.text or len(article.text) < 100:
+            return None, None
+        
+        analysis = collector.analyze(article.title or "", article.text)
+        score, keywords, is_relevant = analysis.score, analysis.keywords, analysis.is_luxury
+        author = collector.extract_author(article, article.text)
+        
+        result = {
+            'url': url,
+            'title': article.title or "No title",
+            'author': author,
+            'score': score,
+            'keywords': len(keywords),
+            'passes': score > 3.0 and is_relevant
+        }
+        
+        status = "✅ PASS" if score > 3.0 and is_relevant else "❌ FAIL"
+        return f"   {status} | Score: {score:.1f} | {article.title[:50]}...", result
+    except Exception as e:
+        return f"   ❌ ERROR: {str(e)[:60]}", None
 
 
 def batch_mode(urls: list[str]):
     """
     Batch mode - check multiple URLs at once
     """
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print(f"BATCH RELEVANCE CHECK - {len(urls)} URLs")
-    print("=" * 70)
+    print(_BAR70)
     
     results = []
+    collector = CustomArticleCollector()
+    domain_locks = DomainLocks()
     
-    for idx, url in enumerate(urls, 1):
-        print(f"\n[{idx}/{len(urls)}] Checking: {url}")
-        try:
-            collector = CustomArticleCollector()
-            
-            # Quick check
-            response = collector.make_request(url, timeout=20)
-            article = Article(url)
-            article.download_state = 2
-            article.html = response.text
-            article.parse()
-            
-            if article.text and len(article.text) >= 100:
-                score, keywords = collector.calculate_relevance_score(article.title or "", article.text)
-                is_relevant = collector.is_luxury_relevant_content(article.title or "", article.text)
-                author = collector.extract_author(article, article.text)
-                
-                results.append({
-                    'url': url,
-                    'title': article.title or "No title",
-                    'author': author,
-                    'score': score,
-                    'keywords': len(keywords),
-                    'passes': score > 3.0 and is_relevant
-                })
-                
-                status = "✅ PASS" if score > 3.0 and is_relevant else "❌ FAIL"
-                print(f"   {status} | Score: {score:.1f} | {article.title[:50]}...")
-        except Exception as e:
-            print(f"   ❌ ERROR: {str(e)[:60]}")
+    # Each URL is processed end to end in a worker thread (parsing handed
+    # off to the process pool); map() keeps the output in input order
+    with create_parse_pool(len(urls)) as parse_pool, \
+            ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+        outcomes = executor.map(
+            lambda url: _process_one(url, collector, parse_pool, domain_locks), urls
+        )
+        for idx, (url, (line, result)) in enumerate(zip(urls, outcomes), 1):
+            print(f"\n[{idx}/{len(urls)}] Checking: {url}")
+            if line:
+                print(line)
+            if result:
+                results.append(result)
     
     # Summary
-    print("\n" + "=" * 70)
-    print("BATCH SUMMARY")
-    print("=" * 70)
-    
     passed = [r for r in results if r['passes']]
     failed = [r for r in results if not r['passes']]
     
-    print(f"\nTotal checked: {len(results)}")
-    print(f"Would be collected: {len(passed)}")
-    print(f"Would be rejected: {len(failed)}\n")
+    out = [
+        "\n" + _BAR70,
+        "BATCH SUMMARY",
+        _BAR70,
+        f"\nTotal checked: {len(results)}",
+        f"Would be collected: {len(passed)}",
+        f"Would be rejected: {len(failed)}\n",
+    ]
     
     if passed:
-        print("ARTICLES THAT WOULD BE COLLECTED:")
+        out.append("ARTICLES THAT WOULD BE COLLECTED:")
         for idx, article in enumerate(passed, 1):
-            print(f"{idx}. [{article['score']:.1f}] {article['title'][:70]}...")
-            print(f"   {article['author']} | {article['keywords']} keywords")
-            print(f"   {article['url']}\n")
-
+            out.append(f"{idx}. [{article['score']:.1f}] {article['title'][:70]}...")
+            out.append(f"   {article['author']} | {article['keywords']} keywords")
+            out.append(f"   {article['url']}\n")
+    
+    emit_lines(out)
 
 def main():
     """
@@ -3,18 +3,159 @@ Google Sheets Storage Backend
 Handles reading from and writing to Google Sheets as a database
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
 from datetime import datetime
+import functools
+import hashlib
 import json
 import os
 import time
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 DEBUG_PROGRESS = os.environ.get("DEBUG_PROGRESS", "true").lower() == "true"
 
+_BAR60 = "=" * 60
+
+
+def _rows_to_records(header, rows):
+    """
+    Build get_all_records()-style dicts from raw rows: short rows are
+    padded and numeric strings converted, like gspread does
+    """
+    from gspread.utils import numericise_all
+
+    width = len(header)
+    return [
+        dict(zip(header, numericise_all(row + [''] * (width - len(row)))))
+        for row in rows
+    ]
+
+
+def _filter_records(values, column, wanted):
+    """
+    Records whose `column` equals `wanted` (case-insensitive)
+    
+    Filters the raw rows on the column index first, so dicts are only
+    built for the rows that are kept
+    """
+    if not values or column not in values[0]:
+        return []
+    header = values[0]
+    col = header.index(column)
+    wanted = wanted.lower()
+    kept = [row for row in values[1:] if col < len(row) and row[col].lower() == wanted]
+    return _rows_to_records(header, kept)
+
+
+def _build_article_rows(articles):
+    """Articles sheet rows, one timestamp for the whole batch"""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return [
+        [
+            article.get('id', ''),
+            article.get('title', ''),
+            article.get('url', ''),
+            article.get('publication', ''),
+            article.get('journalist', 'Unknown'),
+            article.get('summary', ''),
+            now,
+            article.get('score', 0.0),
+        ]
+        for article in articles
+    ]
+
+
+def _build_draft_rows(drafts):
+    """Outreach Drafts sheet rows, one timestamp for the whole batch"""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return [
+        [
+            draft.get('id', ''),
+            draft.get('journalist', ''),
+            draft.get('email', ''),
+            draft.get('subject', ''),
+            draft.get('body', ''),
+            draft.get('topic', ''),
+            'pending',  # status
+            False,      # approved (real boolean - RAW stores 'FALSE' as text)
+            now
+        ]
+        for draft in drafts
+    ]
+
+
+def _append_cells_request(sheet, rows):
+    """
+    appendCells request for spreadsheet.batch_update - values are stored
+    as-is like value_input_option='RAW'
+    """
+    def cell(value):
+        if value is None:
+            return {}
+        if isinstance(value, bool):
+            return {'userEnteredValue': {'boolValue': value}}
+        if isinstance(value, (int, float)):
+            return {'userEnteredValue': {'numberValue': value}}
+        return {'userEnteredValue': {'stringValue': str(value)}}
+    
+    return {
+        'appendCells': {
+            'sheetId': sheet.id,
+            'rows': [{'values': [cell(v) for v in row]} for row in rows],
+            'fields': 'userEnteredValue',
+        }
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(credentials_path, env_creds_hash):
+    """
+    Load service account credentials and authorize a gspread client
+    
+    Cached per process: the RSA key parse and token mint happen once, and
+    the Credentials object refreshes its own token when it expires.
+    env_creds_hash only keys the cache on the GOOGLE_CREDENTIALS contents.
+    
+    Returns:
+        (credentials, client) tuple
+    """
+    # Imported here so importing this module stays cheap
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    # Define scopes (add Drive scope!)
+    scope = [
+        'https://www.googleapis.com/auth/spreadsheets',
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/drive.file'
+    ]
+    
+    # Load credentials
+    if os.path.exists(credentials_path):
+        # Local development
+        creds = Credentials.from_service_account_file(
+            credentials_path,
+            scopes=scope
+        )
+    else:
+        # GitHub Actions (credentials from environment)
+        creds_json = os.getenv('GOOGLE_CREDENTIALS')
+        if creds_json:
+            creds_dict = orjson.loads(creds_json) if ORJSON_AVAILABLE else json.loads(creds_json)
+            creds = Credentials.from_service_account_info(
+                creds_dict,
+                scopes=scope
+            )
+        else:
+            raise ValueError("No credentials found. Set GOOGLE_CREDENTIALS env variable or provide credentials.json")
+    
+    # Authorize and get client
+    return creds, gspread.authorize(creds)
+
 
 class GoogleSheetsDB:
     """
@@ -29,38 +170,14 @@ class GoogleSheetsDB:
             credentials_path: Path to service account JSON file
             sheet_id: Google Sheet ID (from URL)
         """
-        # Define scopes (add Drive scope!)
-        scope = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive',
-            'https://www.googleapis.com/auth/drive.file'
-        ]
-        
-        # Load credentials
-        if os.path.exists(credentials_path):
-            # Local development
-            creds = Credentials.from_service_account_file(
-                credentials_path,
-                scopes=scope
-            )
-        else:
-            # GitHub Actions (credentials from environment)
-            creds_json = os.getenv('GOOGLE_CREDENTIALS')
-            if creds_json:
-                creds_dict = json.loads(creds_json)
-                creds = Credentials.from_service_account_info(
-                    creds_dict,
-                    scopes=scope
-                )
-            else:
-                raise ValueError("No credentials found. Set GOOGLE_CREDENTIALS env variable or provide credentials.json")
+        # Credentials + authorized client are shared by every instance in the
+        # process (keyed on the credentials source)
+        env_creds_hash = hashlib.sha1(os.getenv('GOOGLE_CREDENTIALS', '').encode()).hexdigest()
+        creds, self.client = _get_client(credentials_path, env_creds_hash)
         
         # STORE credentials for later use with Drive API
         self._credentials = creds
         
-        # Authorize and get client
-        self.client = gspread.authorize(creds)
-        
         # Open spreadsheet
         sheet_id = sheet_id or os.getenv('GOOGLE_SHEET_ID')
         if not sheet_id:
@@ -85,14 +202,49 @@ class GoogleSheetsDB:
         except Exception as e:
             raise ValueError(f"Failed to open spreadsheet with ID {sheet_id}: {str(e)}")
         
-        # Get worksheets
+        # Get worksheets (one metadata request for all of them)
         try:
-            self.articles_sheet = self.spreadsheet.worksheet('Articles')
-            self.drafts_sheet = self.spreadsheet.worksheet('Outreach Drafts')
-            self.pitching_sheet = self.spreadsheet.worksheet('Pitching Menu')
-            print("✅ All worksheets found: Articles, Outreach Drafts, Pitching Menu")
+            self._worksheets = {ws.title: ws for ws in self.spreadsheet.worksheets()}
         except Exception as e:
             raise ValueError(f"Failed to find worksheets: {str(e)}")
+        
+        missing = [t for t in ('Articles', 'Outreach Drafts', 'Pitching Menu') if t not in self._worksheets]
+        if missing:
+            raise ValueError(
+                f"Failed to find worksheets: {', '.join(missing)} "
+                f"(found: {', '.join(self._worksheets.keys())})"
+            )
+        
+        self.articles_sheet = self._worksheets['Articles']
+        self.drafts_sheet = self._worksheets['Outreach Drafts']
+        self.pitching_sheet = self._worksheets['Pitching Menu']
+        print("✅ All worksheets found: Articles, Outreach Drafts, Pitching Menu")
+        
+        # draft_id -> row number, built lazily by _find_draft_row
+        self._draft_rows = None
+        
+        # worksheet title -> (fetched_at, values), see _get_values
+        self._values_cache = {}
+        
+        # Articles header and last data row, see _articles_tail
+        self._articles_header = None
+        self._articles_last_row = None
+    
+    def _get_values(self, sheet, ttl=60):
+        """
+        Get all values of a worksheet (header row first)
+        
+        One get_values() call instead of get_all_records(), cached for `ttl`
+        seconds so several readers in the same pipeline run share a fetch.
+        """
+        now = time.monotonic()
+        cached = self._values_cache.get(sheet.title)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        values = sheet.get_values()
+        self._values_cache[sheet.title] = (now, values)
+        return values
     
     def save_articles(self, articles):
         """
@@ -105,27 +257,44 @@ class GoogleSheetsDB:
             print("⚠️  No articles to save")
             return
         
-        rows = []
-        for article in articles:
-            rows.append([
-                article.get('id', ''),
-                article.get('title', ''),
-                article.get('url', ''),
-                article.get('publication', ''),
-                article.get('journalist', 'Unknown'),
-                article.get('summary', ''),
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                article.get('score', 0.0),
-            ])
+        rows = _build_article_rows(articles)
         
         # Append to sheet (keeps history)
         try:
-            self.articles_sheet.append_rows(rows, value_input_option='USER_ENTERED')
+            response = self.articles_sheet.append_rows(rows, value_input_option='RAW')
+            self._values_cache.pop(self.articles_sheet.title, None)
+            self._track_appended_rows(response)
             print(f"✅ Saved {len(articles)} articles to Google Sheets")
         except Exception as e:
             print(f"❌ Error saving articles: {str(e)}")
             raise
     
+    def save_all(self, articles, drafts=None):
+        """
+        Save articles and outreach drafts in a single Sheets API call
+        
+        Args:
+            articles: List of article dictionaries
+            drafts: List of draft email dictionaries (optional)
+        """
+        if not drafts:
+            return self.save_articles(articles)
+        if not articles:
+            return self.save_drafts(drafts)
+        
+        try:
+            self.spreadsheet.batch_update({'requests': [
+                _append_cells_request(self.articles_sheet, _build_article_rows(articles)),
+                _append_cells_request(self.drafts_sheet, _build_draft_rows(drafts)),
+            ]})
+            self._values_cache.pop(self.articles_sheet.title, None)
+            self._articles_last_row = None  # appendCells doesn't report the range
+            self._invalidate_drafts()
+            print(f"✅ Saved {len(articles)} articles and {len(drafts)} drafts to Google Sheets")
+        except Exception as e:
+            print(f"❌ Error saving articles and drafts: {str(e)}")
+            raise
+    
     def get_recent_articles(self, limit=100):
         """
         Get recent articles for summarization
@@ -137,17 +306,48 @@ class GoogleSheetsDB:
             List of article dictionaries
         """
         try:
-            # Get all records (skips header row)
-            records = self.articles_sheet.get_all_records()
-            
-            # Return most recent
-            recent = records[-limit:] if len(records) > limit else records
+            from gspread.utils import rowcol_to_a1
+
+            header, last_row = self._articles_tail()
+            if not header or last_row < 2:
+                recent = []
+            else:
+                # Only fetch the rows we return, not the whole sheet
+                start = max(2, last_row - limit + 1)
+                end_col = rowcol_to_a1(1, len(header)).rstrip('1')
+                rows = self.articles_sheet.get_values(f'A{start}:{end_col}{last_row}')
+                recent = _rows_to_records(header, rows)
             print(f"✅ Retrieved {len(recent)} recent articles")
             return recent
         except Exception as e:
             print(f"❌ Error retrieving articles: {str(e)}")
             return []
     
+    def _articles_tail(self):
+        """
+        (header, last data row) of the Articles sheet
+        
+        Read once (header row + the ID column) and then kept current from
+        the append responses in save_articles.
+        """
+        if self._articles_last_row is None:
+            self._articles_header = self.articles_sheet.row_values(1)
+            self._articles_last_row = len(self.articles_sheet.col_values(1))
+        return self._articles_header, self._articles_last_row
+    
+    def _track_appended_rows(self, response):
+        """Move the cached last row to the end of an append_rows() range"""
+        from gspread.utils import a1_to_rowcol
+
+        if self._articles_last_row is None:
+            return
+        try:
+            updated_range = response['updates']['updatedRange']  # e.g. "Articles!A12:H15"
+            last_row, _ = a1_to_rowcol(updated_range.split(':')[-1])
+            self._articles_last_row = max(self._articles_last_row, last_row)
+        except (KeyError, TypeError, ValueError):
+            self._articles_last_row = None  # unknown - re-read on next use
+    
     def save_drafts(self, drafts):
         """
         Save outreach drafts for review
@@ -159,22 +359,11 @@ class GoogleSheetsDB:
             print("⚠️  No drafts to save")
             return
         
-        rows = []
-        for draft in drafts:
-            rows.append([
-                draft.get('id', ''),
-                draft.get('journalist', ''),
-                draft.get('email', ''),
-                draft.get('subject', ''),
-                draft.get('body', ''),
-                draft.get('topic', ''),
-                'pending',  # status
-                'FALSE',    # approved
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ])
+        rows = _build_draft_rows(drafts)
         
         try:
-            self.drafts_sheet.append_rows(rows, value_input_option='USER_ENTERED')
+            self.drafts_sheet.append_rows(rows, value_input_option='RAW')
+            self._invalidate_drafts()
             print(f"✅ Saved {len(drafts)} drafts to Google Sheets")
         except Exception as e:
             print(f"❌ Error saving drafts: {str(e)}")
@@ -188,10 +377,10 @@ class GoogleSheetsDB:
             List of pending draft dictionaries
         """
         try:
-            records = self.drafts_sheet.get_all_records()
+            values = self._get_values(self.drafts_sheet)
             
             # Filter for pending drafts
-            pending = [r for r in records if r.get('Status', '').lower() == 'pending']
+            pending = _filter_records(values, 'Status', 'pending')
             
             print(f"✅ Retrieved {len(pending)} pending drafts")
             return pending
@@ -207,10 +396,10 @@ class GoogleSheetsDB:
             List of pitching menu dictionaries
         """
         try:
-            records = self.pitching_sheet.get_all_records()
+            values = self._get_values(self.pitching_sheet)
             
             # Filter active items
-            active = [r for r in records if str(r.get('Active', '')).upper() == 'TRUE']
+            active = _filter_records(values, 'Active', 'TRUE')
             
             print(f"✅ Retrieved {len(active)} active pitching menu items")
             return active
@@ -491,6 +680,25 @@ class GoogleSheetsDB:
         except Exception as e:
             print(f"⚠️ Error saving pipeline progress: {str(e)}")
     
+    def _invalidate_drafts(self):
+        """Drop cached drafts data after rows were added (values and the row index)"""
+        self._values_cache.pop(self.drafts_sheet.title, None)
+        self._draft_rows = None
+    
+    def _find_draft_row(self, draft_id):
+        """
+        Look up the sheet row for a draft ID
+        
+        Reads the ID column once and caches it, instead of a full-sheet
+        find() per update. A miss re-reads the column in case the draft
+        was added after the cache was built.
+        """
+        draft_id = str(draft_id)
+        if self._draft_rows is None or draft_id not in self._draft_rows:
+            ids = self.drafts_sheet.col_values(1)
+            self._draft_rows = {str(v): row for row, v in enumerate(ids, start=1) if v}
+        return self._draft_rows.get(draft_id)
+    
     def update_draft_status(self, draft_id, approved=True):
         """
         Update draft status (for future use)
@@ -501,14 +709,17 @@ class GoogleSheetsDB:
         """
         try:
             # Find the row with this draft_id
-            cell = self.drafts_sheet.find(str(draft_id))
-            if cell:
-                row_num = cell.row
-                
-                # Update status columns
+            row_num = self._find_draft_row(draft_id)
+            if row_num:
+                # Update status + approved columns (G:H) in a single API call
                 if approved:
-                    self.drafts_sheet.update_cell(row_num, 7, 'approved')  # Status column
-                    self.drafts_sheet.update_cell(row_num, 8, 'TRUE')      # Approved column
+                    self.drafts_sheet.batch_update(
+                        [{'range': f'G{row_num}:H{row_num}', 'values': [['approved', 'TRUE']]}],
+                        value_input_option='USER_ENTERED'
+                    )
+                    # Status changed - pending/approved readers must re-fetch
+                    # (rows didn't move, so the row index stays valid)
+                    self._values_cache.pop(self.drafts_sheet.title, None)
                 
                 print(f"✅ Draft {draft_id} marked as {'approved' if approved else 'rejected'}")
             else:
@@ -522,9 +733,9 @@ def test_connection():
     """
     Test the Google Sheets connection
     """
-    print("\n" + "="*60)
+    print("\n" + _BAR60)
     print("Testing Google Sheets Connection")
-    print("="*60 + "\n")
+    print(_BAR60 + "\n")
     
     try:
         # Create instance (no import needed - defined in this file)
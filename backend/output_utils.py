@@ -0,0 +1,29 @@
+"""
+Output helpers shared by the collector, the relevance checker and the pipeline runner
+"""
+
+import json
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def emit_lines(lines: list[str]):
+    """Write a block of lines with one write + flush instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def write_json(filename: str, data):
+    """Write data as indented UTF-8 JSON (non-ASCII kept as is)"""
+    if ORJSON_AVAILABLE:
+        # orjson writes UTF-8 bytes directly (same output as ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
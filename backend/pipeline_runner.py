@@ -6,18 +6,12 @@ Integrates AgentCollector, AgentSumm, Google Sheets storage, and PDF generation
 import os
 import sys
 from datetime import datetime
-from google_storage import GoogleSheetsDB
+
+from output_utils import emit_lines, write_json
 
 DEBUG_PROGRESS = os.environ.get("DEBUG_PROGRESS", "true").lower() == "true"
 
-# Import your existing agents
-try:
-    from AgentCollector import CustomArticleCollector
-    from AgentSumm import ArticleSummarizer
-    print("✅ Collector and Summarizer loaded")
-except ImportError as e:
-    print(f"❌ Could not import agents: {e}")
-    sys.exit(1)
+_BAR60 = "=" * 60
 
 # Import PDF generator
 PDF_AVAILABLE = False
@@ -53,9 +47,22 @@ class PipelineRunner:
     """
     
     def __init__(self):
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("Article Pipeline - Initializing")
-        print("="*60 + "\n")
+        print(_BAR60 + "\n")
+        
+        # Heavy imports (gspread, google-auth, newspaper) are deferred to here
+        # so importing this module stays cheap
+        from google_storage import GoogleSheetsDB
+
+        # Import your existing agents
+        try:
+            from AgentCollector import CustomArticleCollector
+            from AgentSumm import ArticleSummarizer
+            print("✅ Collector and Summarizer loaded")
+        except ImportError as e:
+            print(f"❌ Could not import agents: {e}")
+            sys.exit(1)
         
         # Initialize Google Sheets storage
         self.db = GoogleSheetsDB()
@@ -84,9 +91,9 @@ class PipelineRunner:
         """
         Collect top 3 articles from each publication
         """
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("STEP 1: COLLECTING ARTICLES")
-        print("="*60 + "\n")
+        print(_BAR60 + "\n")
         
         try:
             articles = self.collector.collect_top_3_per_publication()
@@ -128,9 +135,9 @@ class PipelineRunner:
         """
         Summarize articles and extract authors using AgentSumm
         """
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("STEP 2: SUMMARIZATION & AUTHOR EXTRACTION")
-        print("="*60 + "\n")
+        print(_BAR60 + "\n")
         
         if not articles_data:
             print("⚠️  No articles to summarize")
@@ -175,9 +182,9 @@ class PipelineRunner:
         """
         Generate PDF output only
         """
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("STEP 2: GENERATING PDF")
-        print("="*60 + "\n")
+        print(_BAR60 + "\n")
         
         if not articles_data:
             print("⚠️  No data to generate PDF")
@@ -194,9 +201,7 @@ class PipelineRunner:
         pdf_file = f"output/weekly_roundup_{date_str}.pdf"
         
         # Save temporary JSON for PDF generator
-        import json
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(articles_data, f, indent=2, ensure_ascii=False)
+        write_json(json_file, articles_data)
         
         # Generate PDF
         try:
@@ -253,9 +258,9 @@ class PipelineRunner:
         """
         Run the complete pipeline
         """
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("🚀 STARTING FULL PIPELINE")
-        print("="*60)
+        print(_BAR60)
         print(f"⏰ Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
         start_time = datetime.now()
@@ -282,7 +287,7 @@ class PipelineRunner:
                 print("[PIPELINE_PROGRESS] calling save_pipeline_progress: final summarizing")
             self.db.save_pipeline_progress("summarizing", 3, 3, "Finalizing output")
             print("\n💾 Saving to Google Sheets...")
-            self.db.save_articles(summarized_articles)
+            self.db.save_all(summarized_articles)
             
             # Step 4: Generate PDF (renumber this)
             pdf_file = self.generate_pdf(summarized_articles)
@@ -306,15 +311,18 @@ class PipelineRunner:
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
-            print("\n" + "="*60)
-            print("✅ PIPELINE COMPLETED SUCCESSFULLY")
-            print("="*60)
-            print(f"⏱️  Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
-            print(f"📊 Articles collected: {len(summarized_articles)}")
+            summary = [
+                "\n" + _BAR60,
+                "✅ PIPELINE COMPLETED SUCCESSFULLY",
+                _BAR60,
+                f"⏱️  Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)",
+                f"📊 Articles collected: {len(summarized_articles)}",
+            ]
             if pdf_file:
-                print(f"📄 PDF file: {pdf_file}")
-            print(f"⏰ End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("="*60 + "\n")
+                summary.append(f"📄 PDF file: {pdf_file}")
+            summary.append(f"⏰ End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            summary.append(_BAR60 + "\n")
+            emit_lines(summary)
             
             return {
                 'success': True,
@@ -327,13 +335,13 @@ class PipelineRunner:
             if DEBUG_PROGRESS:
                 print("[PIPELINE_PROGRESS] calling save_pipeline_progress: failed")
             self.db.save_pipeline_progress("failed", 4, 4, f"Pipeline failed: {str(e)[:200]}")
-            print("\n" + "="*60)
+            print("\n" + _BAR60)
             print("❌ PIPELINE FAILED")
-            print("="*60)
+            print(_BAR60)
             print(f"Error: {str(e)}")
             import traceback
             traceback.print_exc()
-            print("="*60 + "\n")
+            print(_BAR60 + "\n")
             raise
 
 
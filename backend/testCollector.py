@@ -1,16 +1,30 @@
 import feedparser
 import requests
-from newspaper import Article
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import re
 from urllib.parse import urlparse, urljoin
 import time
 import json
-from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
+import sqlite3
+import bisect
+import hashlib
+import email.utils
+import gzip
+import lxml.html
+from lxml import etree
 import random
+import threading
+import functools
+import io
+import os
+import sys
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from output_utils import write_json
 
 # Try to import curl-cffi (most powerful anti-blocking)
 try:
@@ -28,6 +42,37 @@ except ImportError:
     CLOUDSCRAPER_AVAILABLE = False
     print("Note: Install cloudscraper for better anti-blocking: pip install cloudscraper")
 
+# Try to import pyahocorasick (single-pass keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    print("Note: Install pyahocorasick for faster keyword matching: pip install pyahocorasick")
+
+# Try to import orjson (faster JSON-LD parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Note: Install orjson for faster JSON parsing: pip install orjson")
+
+# brotli lets requests/cloudscraper decode 'br' responses (curl-cffi has it built in)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Try to import ciso8601 (C ISO-8601 parser for sitemap lastmod dates)
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+    print("Note: Install ciso8601 for faster sitemap date parsing: pip install ciso8601")
+
 @dataclass
 class ArticleCandidate:
     title: str
@@ -40,7 +85,534 @@ class ArticleCandidate:
     keywords_found: List[str] = None
     full_content: str = ""
 
+@dataclass
+class AnalysisResult:
+    """Content score, matched keywords and luxury validation from one pass"""
+    score: float
+    keywords: List[str]
+    is_luxury: bool
+
+@dataclass
+class ParsedArticle:
+    """Stand-in for newspaper.Article with just the fields the collector reads"""
+    url: str
+    html: str
+    title: str = ""
+    text: str = ""
+    authors: List[str] = field(default_factory=list)
+    meta_description: str = ""
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _first_text(tree, *xpaths) -> str:
+    """First non-empty whitespace-normalized result of the given XPaths"""
+    for xpath in xpaths:
+        for node in tree.xpath(xpath):
+            text = node if isinstance(node, str) else node.text_content()
+            text = _WHITESPACE_RE.sub(' ', text).strip()
+            if text:
+                return text
+    return ""
+
+def _parse_html(html):
+    """Parse a page (str or bytes) with lxml; None if it can't be parsed"""
+    if not html:
+        return None
+    try:
+        try:
+            return lxml.html.fromstring(html)
+        except ValueError:
+            # str input with an XML encoding declaration - hand lxml bytes instead
+            return lxml.html.fromstring(html.encode('utf-8'))
+    except Exception:
+        return None
+
+def fast_extract_article(html: str, url: str) -> Optional[ParsedArticle]:
+    """
+    Pull title, body text, author and description out of a page with one
+    lxml parse and a handful of selectors - much cheaper than newspaper's
+    full parse. Returns None if the page can't be parsed.
+    """
+    tree = _parse_html(html)
+    if tree is None:
+        return None
+
+    # Article body: the <article>/articleBody container with the most paragraphs
+    bodies = tree.xpath('//*[@itemprop="articleBody"] | //article')
+    paragraphs = max((b.xpath('.//p') for b in bodies), key=len, default=[])
+    text = '\n\n'.join(
+        t for t in (_WHITESPACE_RE.sub(' ', p.text_content()).strip() for p in paragraphs) if t
+    )
+
+    author = _first_text(
+        tree,
+        '//meta[@name="author"]/@content',
+        '//*[@rel="author"]',
+    )
+
+    return ParsedArticle(
+        url=url,
+        html=html,
+        title=_first_text(tree, '//meta[@property="og:title"]/@content', '//h1', '//title'),
+        text=text,
+        authors=[author] if author else [],
+        meta_description=_first_text(tree, '//meta[@name="description"]/@content'),
+    )
+
+def parse_article(url: str, html: str, min_text: int = 100):
+    """
+    Parse downloaded HTML, trying fast_extract_article first and falling
+    back to a full newspaper parse when it finds less than min_text
+    characters of body text
+    """
+    parsed = fast_extract_article(html, url)
+    if parsed and len(parsed.text) >= min_text:
+        return parsed
+
+    from newspaper import Article  # heavy import (nltk, PIL) - only when the fast path falls short
+
+    article = Article(url)
+    article.download_state = 2
+    article.html = html
+    article.parse()
+    return article
+
+_SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+_SITEMAP_LOC = _SITEMAP_NS + 'loc'
+_SITEMAP_LASTMOD = _SITEMAP_NS + 'lastmod'
+
+def _parse_lastmod(lastmod_str: Optional[str]) -> datetime:
+    """Sitemap <lastmod> text -> naive datetime (now if missing or unparseable)"""
+    if CISO8601_AVAILABLE and lastmod_str:
+        try:
+            # Handles 'Z', offsets and date-only values natively
+            return ciso8601.parse_datetime(lastmod_str).replace(tzinfo=None)
+        except ValueError:
+            pass
+    try:
+        if 'T' in lastmod_str:
+            lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
+        else:
+            # fromisoformat is C code; strptime goes through the _strptime module
+            lastmod_date = datetime.fromisoformat(lastmod_str[:10])
+        return lastmod_date.replace(tzinfo=None)
+    except Exception:
+        return datetime.now()
+
+def _iter_sitemap_entries(xml_bytes: bytes, encoding: Optional[str] = None):
+    """
+    Stream <sitemap>/<url> entries with lxml iterparse, yielding
+    (kind, loc, lastmod text). Consumed elements are freed as we go, so
+    memory stays flat on multi-MB news sitemaps. encoding overrides the
+    document's own declaration.
+    """
+    sitemap_tag = _SITEMAP_NS + 'sitemap'
+    context = etree.iterparse(
+        io.BytesIO(xml_bytes),
+        events=('end',),
+        tag=(sitemap_tag, _SITEMAP_NS + 'url'),
+        resolve_entities=False,
+        encoding=encoding,
+    )
+    for _, elem in context:
+        # One pass over the children instead of two findtext() tree walks;
+        # first match wins and empty elements read as '', as with findtext
+        loc = lastmod = None
+        for child in elem:
+            tag = child.tag
+            if tag == _SITEMAP_LOC and loc is None:
+                loc = child.text or ''
+            elif tag == _SITEMAP_LASTMOD and lastmod is None:
+                lastmod = child.text or ''
+        if loc is not None:
+            kind = 'sitemap' if elem.tag == sitemap_tag else 'url'
+            yield kind, loc, lastmod
+
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+def parse_sitemap(content: bytes) -> Optional[List[tuple]]:
+    """
+    Parse a sitemap or sitemap index into [(kind, loc, lastmod text)],
+    kind being 'sitemap' (index entry) or 'url'.
+
+    Gzip payloads served without Content-Encoding are recognised by their
+    magic bytes and decompressed once. The bytes go straight to libxml2,
+    which honours the XML encoding declaration; only a document that fails
+    to parse is retried as Latin-1. None if it can't be parsed.
+    """
+    try:
+        if content[:2] == b'\x1f\x8b':
+            content = gzip.decompress(content)
+    except Exception:
+        return None
+
+    for encoding in (None, 'iso-8859-1'):
+        try:
+            return list(_iter_sitemap_entries(content, encoding))
+        except Exception:
+            continue
+    return None
+
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+def _feed_date(text: Optional[str]) -> Optional[time.struct_time]:
+    """RFC 822 or ISO 8601 feed date -> UTC struct_time, like feedparser's *_parsed"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        dt = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return dt.utctimetuple()
+
+def _fast_parse_feed(xml_bytes: bytes) -> List[dict]:
+    """
+    RSS 2.0 / Atom entries with one lxml parse, as feedparser-style dicts
+    holding only the fields try_rss_feed reads (title, link, summary,
+    published_parsed). Raises on XML it can't parse.
+    """
+    root = etree.fromstring(xml_bytes, parser=etree.XMLParser(resolve_entities=False))
+    entries = []
+
+    for item in root.iterfind('channel/item'):
+        entries.append({
+            'title': item.findtext('title') or '',
+            'link': item.findtext('link') or '',
+            'summary': item.findtext('description') or '',
+            'published_parsed': _feed_date(item.findtext('pubDate')),
+        })
+
+    for entry in root.iterfind(_ATOM_NS + 'entry'):
+        link = ''
+        for link_elem in entry.iterfind(_ATOM_NS + 'link'):
+            if link_elem.get('rel', 'alternate') == 'alternate':
+                link = link_elem.get('href', '')
+                break
+        entries.append({
+            'title': entry.findtext(_ATOM_NS + 'title') or '',
+            'link': link,
+            'summary': entry.findtext(_ATOM_NS + 'summary') or '',
+            'published_parsed': _feed_date(entry.findtext(_ATOM_NS + 'published')),
+        })
+
+    return entries
+
+def parse_feed_entries(content: bytes) -> list:
+    """Feed entries via _fast_parse_feed, falling back to feedparser for anything else"""
+    try:
+        entries = _fast_parse_feed(content)
+        if entries:
+            return entries
+    except Exception:
+        pass
+    return feedparser.parse(content).entries
+
+# Feed hosts that need curl-cffi impersonation with feed-specific headers
+_PREMIUM_DOMAINS = frozenset(('downjones.io', 'wsj.com', 'nytimes.com'))
+
+def _canonical_url(url: str) -> str:
+    """Dedup key for article URLs - trailing-slash and case variants collapse"""
+    return url.rstrip('/').lower()
+
+def _url_fingerprint(url: str) -> int:
+    """
+    64-bit blake2b digest of _canonical_url(url) - for dedup sets that
+    outlive the candidates, where a small int is cheaper to keep than the
+    URL string (collisions are ~1 in 10^19 per pair)
+    """
+    digest = hashlib.blake2b(_canonical_url(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+@functools.lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lowercased host of a URL (cached - the same URLs are parsed repeatedly)"""
+    return urlparse(url).netloc.lower()
+
+# Response bodies are cut off beyond this (pathological pages); sitemaps
+# get the 50 MB the sitemap protocol allows
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+
+# extract_title_from_page reads at most this much of a page looking for <title>
+TITLE_SCAN_BYTES = 64 * 1024
+
+# charset=... in a Content-Type header or <meta charset> / http-equiv tag
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+def _decode_page_text(raw: bytes, content_type: Optional[str], head: bytes) -> str:
+    """
+    Decode a slice of an HTML page: charset from the Content-Type header,
+    else from a <meta> tag in head (lowercased page prefix), else UTF-8
+    with a cp1252 fallback for legacy pages
+    """
+    match = _CHARSET_RE.search((content_type or '').encode('latin-1', errors='ignore')) or _CHARSET_RE.search(head)
+    if match:
+        try:
+            return raw.decode(match.group(1).decode('ascii'), errors='replace')
+        except LookupError:
+            pass
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('cp1252', errors='replace')
+
+# Max publications whose Stage 1 (sitemap/RSS) runs concurrently
+STAGE1_WORKERS = 8
+
+# Threads of the collector's long-lived pool for leaf fetches (RSS feeds,
+# sub-sitemaps). Kept alive so each thread's session - and its open
+# keep-alive connections - is reused from one publication to the next
+FETCH_POOL_WORKERS = 16
+
+# Pool threads one host may occupy at once - the per-host rate limit burst.
+# Further fetches to that host queue behind these instead of each holding
+# a thread while it sleeps for a token
+FETCH_PER_HOST = 3
+
+# Stage 2 (full-content download): worker threads overall, and how many
+# downloads one publication may have in flight at once
+STAGE2_WORKERS = 8
+STAGE2_PER_PUBLICATION = 2
+
+# Candidates downloaded per publication in Stage 2 (safety limit)
+STAGE2_MAX_DOWNLOADS = 100
+
+# Stage 2 stops downloading a publication's candidates once this many of
+# them have scored at least STAGE2_STRONG_SCORE (top 3 are already strong)
+STAGE2_STRONG_COUNT = 3
+STAGE2_STRONG_SCORE = 40.0
+
+# TATERTOT_QUIET=true drops the log lines printed inside Stage 1/Stage 2
+# worker threads (per-fetch errors, HTTP statuses); summaries are kept
+QUIET_WORKERS = os.environ.get("TATERTOT_QUIET", "false").lower() == "true"
+
+# On-disk store of feed/sitemap bodies revalidated with ETag/Last-Modified
+HTTP_CACHE_PATH = '.tt_http_cache.sqlite'
+
+# How long an extracted article (text, author, ...) is reused before re-downloading
+ARTICLE_CACHE_TTL = 24 * 3600
+
+# Stored feed/sitemap bodies and parsed sitemaps not used for this long are dropped
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600
+
+class _HTTPCache:
+    """
+    Tiny sqlite-backed conditional-GET cache: url -> (etag, last_modified, body).
+    A 304 from the server means the stored body is still current, so warm
+    runs skip re-downloading feeds and sitemaps that haven't changed.
+
+    Parsed sitemap entries are kept alongside, keyed by URL and a digest of
+    the body they came from, so an unchanged sitemap isn't re-parsed either.
+    Extracted articles are stored too, so reruns within ARTICLE_CACHE_TTL
+    re-score them without downloading the page again.
+
+    Expired articles and bodies unused for HTTP_CACHE_MAX_AGE are deleted
+    when the cache is opened, so the file doesn't grow run after run.
+    """
+
+    def __init__(self, path: str = HTTP_CACHE_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, fetched_at REAL)'
+        )
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(sitemap_entries)')]
+        if columns and 'fetched_at' not in columns:
+            self._conn.execute('DROP TABLE sitemap_entries')  # older layout - it's only a cache
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS sitemap_entries ('
+            'url TEXT PRIMARY KEY, digest TEXT, entries BLOB, fetched_at REAL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            'key TEXT PRIMARY KEY, payload BLOB, fetched_at REAL)'
+        )
+        self._prune()
+        self._conn.commit()
+
+    def _prune(self):
+        now = time.time()
+        self._conn.execute('DELETE FROM articles WHERE fetched_at < ?', (now - ARTICLE_CACHE_TTL,))
+        self._conn.execute('DELETE FROM responses WHERE fetched_at < ?', (now - HTTP_CACHE_MAX_AGE,))
+        self._conn.execute('DELETE FROM sitemap_entries WHERE fetched_at < ?', (now - HTTP_CACHE_MAX_AGE,))
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Canonical cache key: lowercase scheme/host, no fragment"""
+        parsed = urlparse(url)
+        return parsed._replace(
+            scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment=''
+        ).geturl()
+
+    def get(self, url: str):
+        with self._lock:
+            return self._conn.execute(
+                'SELECT etag, last_modified, body FROM responses WHERE url = ?', (self.key(url),)
+            ).fetchone()
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                (self.key(url), etag, last_modified, body, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """Mark a stored body as still current (it was just revalidated)"""
+        with self._lock:
+            self._conn.execute('UPDATE responses SET fetched_at = ? WHERE url = ?', (time.time(), self.key(url)))
+            self._conn.commit()
+
+    def get_entries(self, url: str, digest: str) -> Optional[List[tuple]]:
+        """Parsed sitemap entries stored for this URL, if they came from the same body"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT entries FROM sitemap_entries WHERE url = ? AND digest = ?', (self.key(url), digest)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE sitemap_entries SET fetched_at = ? WHERE url = ?', (time.time(), self.key(url))
+            )
+            self._conn.commit()
+        entries = orjson.loads(row[0]) if ORJSON_AVAILABLE else json.loads(row[0])
+        return [tuple(entry) for entry in entries]
+
+    def put_entries(self, url: str, digest: str, entries: List[tuple]):
+        blob = orjson.dumps(entries) if ORJSON_AVAILABLE else json.dumps(entries).encode('utf-8')
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sitemap_entries VALUES (?, ?, ?, ?)',
+                (self.key(url), digest, blob, time.time())
+            )
+            self._conn.commit()
+
+    def _article_key(self, url: str) -> str:
+        return hashlib.sha1(self.key(url).encode('utf-8')).hexdigest()
+
+    def get_article(self, url: str, max_age: float = ARTICLE_CACHE_TTL) -> Optional[dict]:
+        """Extracted article payload for this URL, if stored less than max_age seconds ago"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM articles WHERE key = ? AND fetched_at > ?',
+                (self._article_key(url), time.time() - max_age)
+            ).fetchone()
+        if row is None:
+            return None
+        return orjson.loads(row[0]) if ORJSON_AVAILABLE else json.loads(row[0])
+
+    def put_article(self, url: str, payload: dict):
+        blob = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8')
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO articles VALUES (?, ?, ?)',
+                (self._article_key(url), blob, time.time())
+            )
+            self._conn.commit()
+
+class _ThreadBufferedStdout:
+    """
+    sys.stdout wrapper that gives threads inside run_captured() their own
+    buffer, so publications can be collected concurrently while their log
+    lines still come out grouped per publication
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def run_captured(self, fn, *args):
+        """Call fn(*args) with this thread's output buffered -> (result, output)"""
+        previous = getattr(self._local, 'buffer', None)
+        buffer = self._local.buffer = io.StringIO()
+        try:
+            return fn(*args), buffer.getvalue()
+        finally:
+            self._local.buffer = previous
+
+# Core luxury/jewelry terms - content must mention at least one to pass validation
+CORE_LUXURY_TERMS = frozenset((
+    'jewellery', 'jewelry', 'jeweler', 'jeweller',
+    'diamond', 'necklace', 'bracelet', 'earring', 'ring', 'brooch', 'pendant',
+    'cartier', 'tiffany', 'bulgari', 'chanel', 'van cleef',
+    'graff', 'harry winston', 'chopard', 'piaget', 'boucheron',
+    'gemstone', 'emerald', 'sapphire', 'ruby', 'pearl',
+    'fine jewellery', 'high jewelry', 'haute joaillerie',
+    'luxury brand', 'luxury fashion', 'luxury goods'
+))
+
+@functools.lru_cache(maxsize=8)
+def _keyword_automaton(keywords_lower: tuple):
+    """
+    Aho-Corasick automaton over the lowercased keywords and core luxury
+    terms -> (keyword index or -1, is core term). Built once per process
+    per keyword list and shared - iter() on a finished automaton is read-only.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    payloads = {}
+    for idx, kw_lower in enumerate(keywords_lower):
+        payloads[kw_lower] = (idx, False)
+    for term in CORE_LUXURY_TERMS:
+        idx, _ = payloads.get(term, (-1, False))
+        payloads[term] = (idx, True)
+
+    automaton = ahocorasick.Automaton()
+    for word, payload in payloads.items():
+        automaton.add_word(word, payload)
+    automaton.make_automaton()
+    return automaton
+
 class CustomArticleCollector:
+    # National Jeweler category/section pages - never articles
+    _NATIONAL_JEWELER_EXCLUDED = frozenset((
+        'https://nationaljeweler.com/',
+        'https://nationaljeweler.com/industry',
+        'https://nationaljeweler.com/industry/industry-other',
+        'https://nationaljeweler.com/industry/independents',
+        'https://nationaljeweler.com/industry/events-awards',
+        'https://nationaljeweler.com/industry/financials',
+        'https://nationaljeweler.com/industry/supplier-bulletin',
+        'https://nationaljeweler.com/industry/technology',
+        'https://nationaljeweler.com/industry/surveys',
+        'https://nationaljeweler.com/industry/policies-issues',
+        'https://nationaljeweler.com/industry/crime',
+        'https://nationaljeweler.com/industry/majors',
+        'https://nationaljeweler.com/diamonds-gems',
+        'https://nationaljeweler.com/diamonds-gems/diamonds-gems-other',
+        'https://nationaljeweler.com/diamonds-gems/lab-grown',
+        'https://nationaljeweler.com/diamonds-gems/grading',
+        'https://nationaljeweler.com/diamonds-gems/sourcing',
+        'https://nationaljeweler.com/style',
+        'https://nationaljeweler.com/style/style-other',
+        'https://nationaljeweler.com/style/trends',
+        'https://nationaljeweler.com/style/auctions',
+        'https://nationaljeweler.com/style/watches',
+        'https://nationaljeweler.com/style/collections',
+        'https://nationaljeweler.com/opinions',
+        'https://nationaljeweler.com/opinions/editors',
+        'https://nationaljeweler.com/opinions/columnists'
+    ))
+
+    # "By Firstname Lastname" byline, the last-resort author source
+    _AUTHOR_RE = re.compile(r"\b[Bb]y\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)")
+
     def __init__(self):
         """Initialize collector with your specific sources and keywords"""
 
@@ -60,6 +632,21 @@ class CustomArticleCollector:
             'Diamond price', 'Gold price', 'jewels'
         ]
 
+        # Lowercased once here instead of once per keyword per article
+        self._luxury_keywords_lower = tuple(k.lower() for k in self.luxury_keywords)
+
+        # Per-keyword weights for full content scoring (built once, not per article)
+        self.keyword_weight_map = self._build_keyword_weight_map()
+        self._keyword_weights = {
+            keyword: self.keyword_weight_map.get(kw_lower, 1.0)
+            for keyword, kw_lower in zip(self.luxury_keywords, self._luxury_keywords_lower)
+        }
+
+        # Matches every keyword in one pass over the text (None without pyahocorasick)
+        self._keyword_automaton = _keyword_automaton(self._luxury_keywords_lower)
+        # Longest keyword/core term - bounds the title/content seam that has to be rescanned
+        self._max_term_len = max(map(len, (*self._luxury_keywords_lower, *CORE_LUXURY_TERMS)))
+
         # Your specific publication sources - MULTIPLE RSS FEEDS SUPPORTED
         self.target_sources = {
             'The Guardian': {
@@ -244,25 +831,27 @@ class CustomArticleCollector:
         # Initialize scraper with priority order
         if CURL_CFFI_AVAILABLE:
             # curl-cffi is the most powerful - mimics real browsers perfectly
-            self.scraper = curl_requests.Session()
             self.scraper_type = 'curl-cffi'
             print("✅ curl-cffi enabled (most powerful anti-blocking)")
             print("   Can bypass CloudFlare, SSL checks, and bot detection\n")
         elif CLOUDSCRAPER_AVAILABLE:
-            self.scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'mobile': False
-                }
-            )
             self.scraper_type = 'cloudscraper'
             print("✅ CloudScraper enabled for anti-blocking\n")
         else:
-            self.scraper = requests.Session()
             self.scraper_type = 'requests'
             print("⚠️  Using basic requests (limited anti-blocking)\n")
 
+        # Sessions are created lazily per thread (see `scraper`)
+        self._local = threading.local()
+        self._fetch_pool = None
+        self._fetch_pool_lock = threading.Lock()
+
+        # Only advertise br when the response can actually be decoded
+        if self.scraper_type == 'curl-cffi' or BROTLI_AVAILABLE:
+            self.accept_encoding = 'gzip, deflate, br'
+        else:
+            self.accept_encoding = 'gzip, deflate'
+
         # User-Agent rotation
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -276,42 +865,234 @@ class CustomArticleCollector:
 
         # Rate limiting
         self.request_count = 0
-        self.last_request_time = time.time()
-        self.min_delay_between_requests = 2.0
-        self.max_delay_between_requests = 5.0
         self.requests_per_source = 0
         self.max_requests_per_minute = 20
+        # Token bucket per host: each refills at max_requests_per_minute and
+        # allows short bursts, so requests to different sites never wait on each other
+        self._bucket_rate = self.max_requests_per_minute / 60.0
+        self._bucket_capacity = float(FETCH_PER_HOST)
+        self._host_buckets: Dict[str, list] = {}  # host -> [tokens, last refill time]
+        self._rate_lock = threading.Lock()  # guards the bucket math only, never held while sleeping
+
+        # Sitemaps repeat URLs across sections; the check depends only on the URL
+        # and this instance's keywords, so memoize it per collector
+        self._relevant_url_cached = functools.lru_cache(maxsize=65536)(self._check_relevant_url)
+
+        # Conditional-GET cache for feeds and sitemaps (optional - runs fine without it)
+        try:
+            self.http_cache = _HTTPCache()
+        except sqlite3.Error as e:
+            print(f"Note: HTTP cache disabled ({e})")
+            self.http_cache = None
+
+    def _build_keyword_weight_map(self) -> Dict[str, float]:
+        """Lowercased keyword -> weight; keywords not listed score 1.0"""
+        return {
+            # Core priority keywords
+            'jewellery': 4.0, 'fine jewellery': 4.0, 'craftsmanship': 4.0, 'royal': 4.0,
+            'royals': 4.0, 'fashion week': 4.0, 'jewels': 4.0,
+            # Primary jewelry terms
+            'jewelry': 5.0, 'diamond': 5.0, 'engagement ring': 5.0, 'wedding ring': 5.0,
+            # Jewelry pieces and materials
+            'necklace': 5.0, 'bracelet': 5.0, 'earrings': 5.0, 'pendant': 5.0, 'brooch': 5.0,
+            'gold': 5.0, 'platinum': 5.0, 'silver': 5.0, 'emerald': 5.0, 'sapphire': 5.0, 'ruby': 5.0,
+            # Premium luxury brands
+            'cartier': 3.5, 'tiffany': 3.5, 'bulgari': 3.5, 'chanel': 3.5, 'dior': 3.5, 'van cleef': 3.5,
+            'graff': 3.5, 'harry winston': 3.5, 'chopard': 3.5, 'piaget': 3.5, 'boucheron': 3.5,
+            # Fashion and luxury terms
+            'fashion': 2.5, 'accessories': 2.5, 'watches': 2.5, 'timepiece': 2.5, 'collection': 2.5,
+            'launch': 2.5, 'haute couture': 2.5, 'limited edition': 2.5,
+            # Events and celebrity
+            'red carpet': 2.0, 'celebrity': 2.0, 'auction': 2.0, 'luxury': 2.0,
+            # Industry terms
+            'collaboration': 0.5, 'investment': 0.5, 'trends': 0.5, 'style': 0.5,
+        }
 
-    def get_random_user_agent(self):
-        return random.choice(self.user_agents)
+    def _find_keywords(self, *texts_lower: str) -> List[str]:
+        """Keywords contained in any of the already-lowercased texts, in keyword list order"""
+        if self._keyword_automaton is None:
+            return [
+                keyword
+                for keyword, kw_lower in zip(self.luxury_keywords, self._luxury_keywords_lower)
+                if any(kw_lower in text for text in texts_lower)
+            ]
+
+        hits = {
+            idx
+            for text in texts_lower
+            for _, (idx, _) in self._keyword_automaton.iter(text)
+            if idx >= 0
+        }
+        return [self.luxury_keywords[idx] for idx in sorted(hits)]
 
-    def apply_rate_limit(self):
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _has_keyword(self, text_lower: str) -> bool:
+        """True if already-lowercased text contains any keyword (stops at the first)"""
+        if self._keyword_automaton is None:
+            return any(kw_lower in text_lower for kw_lower in self._luxury_keywords_lower)
 
-        if time_since_last < self.min_delay_between_requests:
-            sleep_time = self.min_delay_between_requests - time_since_last
-            time.sleep(sleep_time)
+        return any(idx >= 0 for _, (idx, _) in self._keyword_automaton.iter(text_lower))
 
-        random_delay = random.uniform(0, self.max_delay_between_requests - self.min_delay_between_requests)
-        time.sleep(random_delay)
+    def _scan_keywords(self, *texts_lower: str) -> tuple:
+        """
+        (keywords found in keyword list order, whether any core luxury term
+        occurs) from a single pass over each already-lowercased text
+        """
+        if self._keyword_automaton is None:
+            return (
+                self._find_keywords(*texts_lower),
+                any(self._has_core_luxury_term(text) for text in texts_lower),
+            )
 
-        self.last_request_time = time.time()
-        self.request_count += 1
+        hits = set()
+        has_core = False
+        for text in texts_lower:
+            for _, (idx, is_core) in self._keyword_automaton.iter(text):
+                if idx >= 0:
+                    hits.add(idx)
+                if is_core:
+                    has_core = True
+        return [self.luxury_keywords[idx] for idx in sorted(hits)], has_core
+
+    def _lower_parts(self, title: str, content: str) -> tuple:
+        """
+        Lowercased title, content and the seam between them - together they
+        match exactly what f"{title} {content}".lower() would, without
+        building that copy of the whole article
+        """
+        title_lower = title.lower()
+        content_lower = content.lower()
+        return title_lower, content_lower, self._seam(title_lower, content_lower)
+
+    def _create_scraper(self):
+        """Create a new HTTP session for the configured scraper type"""
+        if self.scraper_type == 'curl-cffi':
+            # Impersonation is set once per session; its pooled connections
+            # (HTTP/2 where the server offers it) are reused across requests
+            return curl_requests.Session(impersonate="chrome110")  # Mimics Chrome 110 perfectly
+        if self.scraper_type == 'cloudscraper':
+            return cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                }
+            )
 
-        if self.request_count % self.max_requests_per_minute == 0:
-            print(f"  Rate limit: Processed {self.request_count} requests, brief pause...")
-            time.sleep(random.uniform(5, 10))
+        # Plain requests: bigger keep-alive pool and retries on connection errors
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def scraper(self):
+        """Per-thread session - curl-cffi/cloudscraper sessions are not thread-safe"""
+        session = getattr(self._local, 'scraper', None)
+        if session is None:
+            session = self._create_scraper()
+            self._local.scraper = session
+        return session
+
+    @property
+    def fetch_pool(self) -> ThreadPoolExecutor:
+        """
+        Long-lived pool for leaf fetches (tasks must not submit to it themselves).
+        Its threads outlive each call, so their per-thread sessions do too.
+        """
+        with self._fetch_pool_lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(
+                    max_workers=FETCH_POOL_WORKERS, thread_name_prefix='tt-fetch'
+                )
+            return self._fetch_pool
+
+    def _fetch_map(self, fn, urls: List[str]) -> list:
+        """
+        [fn(url) for url in urls], run on fetch_pool. Each host gets at most
+        FETCH_PER_HOST lanes that work through its URLs sequentially, so a
+        rate-limited host can't tie up the whole pool.
+
+        While sys.stdout is buffering per publication, each call's output is
+        captured on the pool thread and written from the calling thread in
+        URL order, so it lands in the caller's buffer instead of going
+        straight to the console.
+        """
+        stdout = sys.stdout
+        if isinstance(stdout, _ThreadBufferedStdout):
+            call = lambda url: stdout.run_captured(fn, url)
+        else:
+            call = lambda url: (fn(url), '')
 
-    def make_request(self, url: str, timeout: int = 10):
-        """Make HTTP request with curl-cffi for better anti-blocking"""
-        self.apply_rate_limit()
+        by_host = {}
+        for idx, url in enumerate(urls):
+            by_host.setdefault(_netloc(url), []).append(idx)
+
+        def run_lane(indices):
+            return [(idx, *call(urls[idx])) for idx in indices]
+
+        futures = [
+            self.fetch_pool.submit(run_lane, indices[lane::FETCH_PER_HOST])
+            for indices in by_host.values()
+            for lane in range(min(FETCH_PER_HOST, len(indices)))
+        ]
+
+        results = [None] * len(urls)
+        outputs = [''] * len(urls)
+        for future in futures:
+            for idx, result, output in future.result():
+                results[idx] = result
+                outputs[idx] = output
+        if outputs:
+            stdout.write(''.join(outputs))
+        return results
+
+    def get_random_user_agent(self):
+        return random.choice(self.user_agents)
+
+    def apply_rate_limit(self, url: str):
+        # Each caller reserves the next slot on its host's bucket under the lock,
+        # then sleeps on its own - only callers that exceed that host's rate wait
+        host = _netloc(url)
+        with self._rate_lock:
+            now = time.monotonic()
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = self._host_buckets[host] = [self._bucket_capacity, now]
+            tokens = min(self._bucket_capacity, bucket[0] + (now - bucket[1]) * self._bucket_rate) - 1
+            bucket[0] = tokens
+            bucket[1] = now
+            wait = -tokens / self._bucket_rate if tokens < 0 else 0.0
+
+            self.request_count += 1
+            if self.request_count % self.max_requests_per_minute == 0:
+                print(f"  Rate limit: Processed {self.request_count} requests")
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def make_request(self, url: str, timeout: int = 10, max_bytes: int = MAX_RESPONSE_BYTES,
+                     use_cache: bool = False, stop_at: Optional[bytes] = None):
+        """
+        Make HTTP request with curl-cffi for better anti-blocking
+
+        The body is streamed and capped at max_bytes; .content/.text work as usual.
+        With use_cache the request is made conditional on the stored ETag /
+        Last-Modified, and a 304 comes back as a 200 carrying the cached body.
+        With stop_at (lowercase bytes) the download ends as soon as the marker
+        has been read, leaving only the body up to there.
+        """
+        self.apply_rate_limit(url)
 
         headers = {
             'User-Agent': self.get_random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': self.accept_encoding,
             'Connection': 'keep-alive',
             'Referer': 'https://www.google.com/',
             'Upgrade-Insecure-Requests': '1',
@@ -321,23 +1102,32 @@ class CustomArticleCollector:
             'Cache-Control': 'max-age=0'
         }
 
+        cached = self.http_cache.get(url) if use_cache and self.http_cache else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         try:
             if self.scraper_type == 'curl-cffi':
-                # curl-cffi with browser impersonation (best for bypassing blocks)
+                # curl-cffi session impersonates Chrome (best for bypassing blocks)
                 response = self.scraper.get(
                     url,
                     headers=headers,
                     timeout=timeout,
-                    impersonate="chrome110",  # Mimics Chrome 110 perfectly
-                    verify=True
+                    verify=True,
+                    stream=True
                 )
             else:
                 # Fallback to cloudscraper or requests
-                response = self.scraper.get(url, headers=headers, timeout=timeout)
+                response = self.scraper.get(url, headers=headers, timeout=timeout, stream=True)
+
+            self._finish_response(response, url, max_bytes, stop_at, use_cache, cached)
 
             if response.status_code != 200:
-                domain = urlparse(url).netloc
-                if 'telegraph' in domain.lower():
+                if 'telegraph' in _netloc(url):
                     print(f"    HTTP {response.status_code} - Telegraph blocking detected")
                 else:
                     print(f"    HTTP {response.status_code} error for {url}")
@@ -349,7 +1139,7 @@ class CustomArticleCollector:
 
             # Handle SSL errors specifically
             if 'SSL' in error_msg or 'ssl' in error_msg.lower():
-                print(f"    SSL Error: {urlparse(url).netloc} is blocking with SSL handshake")
+                print(f"    SSL Error: {_netloc(url)} is blocking with SSL handshake")
 
                 # Try one more time without verification (curl-cffi only)
                 if self.scraper_type == 'curl-cffi':
@@ -359,27 +1149,100 @@ class CustomArticleCollector:
                             url,
                             headers=headers,
                             timeout=timeout,
-                            impersonate="chrome110",
-                            verify=False  # Disable SSL verification
+                            verify=False,  # Disable SSL verification
+                            stream=True
                         )
-                        return response
+                        return self._finish_response(response, url, max_bytes, stop_at, use_cache, cached)
                     except:
                         pass
 
             print(f"    Request error: {error_msg[:100]}")
             raise
 
+    def _finish_response(self, response, url: str, max_bytes: int, stop_at: Optional[bytes],
+                         use_cache: bool, cached):
+        """
+        Read the capped body; with use_cache, also turn a 304 into the stored
+        body or remember a fresh 200's validators
+        """
+        self._read_capped(response, url, max_bytes, stop_at)
+        if use_cache and self.http_cache:
+            self._revalidate(response, url, cached, max_bytes)
+        return response
+
+    def _read_capped(self, response, url: str, max_bytes: int, stop_at: Optional[bytes] = None):
+        """
+        Read a streamed response body up to max_bytes (or through stop_at)
+        and store it on the response, so downstream code can keep using
+        .content/.text
+        """
+        body = bytearray()
+        try:
+            # curl-cffi picks its own chunk size (and warns if given one)
+            if self.scraper_type == 'curl-cffi':
+                chunks = response.iter_content()
+            else:
+                chunks = response.iter_content(65536)
+
+            for chunk in chunks:
+                body += chunk
+                if stop_at:
+                    # Only the new chunk (plus a marker's overlap) needs checking
+                    window = body[max(0, len(body) - len(chunk) - len(stop_at)):]
+                    if stop_at in window.lower():
+                        break
+                if len(body) > max_bytes:
+                    del body[max_bytes:]
+                    if not stop_at:
+                        print(f"    Response truncated at {max_bytes // (1024 * 1024)} MB: {url}")
+                    break
+        finally:
+            response.close()
+
+        self._set_body(response, bytes(body))
+        return response
+
+    def _set_body(self, response, body: bytes):
+        """Store body on a curl-cffi or requests response so .content/.text see it"""
+        if self.scraper_type == 'curl-cffi':
+            response.content = body
+        else:
+            response._content = body
+            response._content_consumed = True
+
+    def _revalidate(self, response, url: str, cached, max_bytes: int):
+        """Serve the cached body on 304; remember validators of a fresh 200"""
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            self._set_body(response, cached[2])
+            try:
+                self.http_cache.touch(url)
+            except sqlite3.Error:
+                pass
+        elif response.status_code == 200 and len(response.content) < max_bytes:  # never cache a truncated body
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                try:
+                    self.http_cache.put(url, etag, last_modified, response.content)
+                except sqlite3.Error:
+                    pass
+
     def extract_author(self, article, text: str) -> str:
         """Extract author name using JSON-LD, meta tags, or regex scanning."""
         author = None
 
         # 1. Try JSON-LD parsing
         try:
-            soup = BeautifulSoup(article.html, "html.parser")
-            scripts = soup.find_all("script", type="application/ld+json")
+            tree = _parse_html(article.html)
+            scripts = tree.xpath('//script[@type="application/ld+json"]/text()') if tree is not None else []
             for script in scripts:
+                raw = str(script)  # lxml smart string -> plain str (orjson wants exact str)
+                # Only blocks that mention "author" can yield one - skip the rest unparsed
+                if not raw or '"author"' not in raw:
+                    continue
                 try:
-                    data = json.loads(script.string)
+                    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                     if isinstance(data, list):
                         for entry in data:
                             if isinstance(entry, dict) and "author" in entry:
@@ -406,7 +1269,7 @@ class CustomArticleCollector:
             article.text or ""
         ])
 
-        match = re.search(r"\b[Bb]y\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)", combined_text)
+        match = self._AUTHOR_RE.search(combined_text)
         if match:
             return match.group(1)
 
@@ -429,57 +1292,54 @@ class CustomArticleCollector:
         Returns (score, keywords_found)
         """
         combined_text = f"{title} {url}".lower()
-        found_keywords = []
         
         # Just check if ANY keyword exists
-        for keyword in self.luxury_keywords:
-            if keyword.lower() in combined_text:
-                found_keywords.append(keyword)
+        found_keywords = self._find_keywords(combined_text)
         
         # Simple scoring: 1 point per keyword found
         score = len(found_keywords) * 1.0
             
         return score, found_keywords
 
+    def calculate_title_relevance_scores(self, pairs: List[tuple]) -> List[tuple]:
+        """
+        Batch form of calculate_title_relevance_score over (title, url) pairs.
+        With the automaton, all texts are joined with NUL separators and
+        scanned once; each hit is mapped back to its text by end offset.
+        """
+        texts = [f"{title} {url}".lower() for title, url in pairs]
+        if self._keyword_automaton is None:
+            found = [self._find_keywords(text) for text in texts]
+        else:
+            # Offset where each text ends in the joined string (keywords never contain NUL)
+            ends = []
+            pos = -1
+            for text in texts:
+                pos += len(text) + 1
+                ends.append(pos)
+
+            hits = [set() for _ in texts]
+            for end, (idx, _) in self._keyword_automaton.iter('\0'.join(texts)):
+                if idx >= 0:
+                    hits[bisect.bisect_left(ends, end)].add(idx)
+            found = [[self.luxury_keywords[idx] for idx in sorted(h)] for h in hits]
+
+        # Same scoring as calculate_title_relevance_score: 1 point per keyword
+        return [(len(keywords) * 1.0, keywords) for keywords in found]
+
     def calculate_relevance_score(self, title: str, content: str) -> tuple:
         """
         STAGE 2: Full content scoring (after downloading)
         """
-        combined_text = f"{title} {content}".lower()
-        found_keywords = []
+        found_keywords = self._find_keywords(*self._lower_parts(title, content))
+        return self._score_keywords(found_keywords), found_keywords
+
+    def _score_keywords(self, found_keywords: List[str]) -> float:
+        """Weighted score for matched keywords, with the multi-match bonuses"""
         score = 0.0
 
-        for keyword in self.luxury_keywords:
-            if keyword.lower() in combined_text:
-                found_keywords.append(keyword)
-
-                # Core priority keywords
-                if keyword.lower() in ['jewellery', 'fine jewellery', 'craftsmanship', 'royal', 'royals', 'fashion week', 'jewels']:
-                    score += 4.0
-                # Primary jewelry terms
-                elif keyword.lower() in ['jewelry', 'diamond', 'engagement ring', 'wedding ring', 'Lab grown diamonds',
-                                         'Diamond price', 'Gold price', 'Luxury sector', 'Luxury marketing trends']:
-                    score += 5.0
-                # Jewelry pieces and materials
-                elif keyword.lower() in ['necklace', 'bracelet', 'earrings', 'pendant', 'brooch',
-                                         'gold', 'platinum', 'silver', 'emerald', 'sapphire', 'ruby']:
-                    score += 5.0
-                # Premium luxury brands
-                elif keyword.lower() in ['cartier', 'tiffany', 'bulgari', 'chanel', 'dior', 'van cleef',
-                                         'graff', 'harry winston', 'chopard', 'piaget', 'boucheron']:
-                    score += 3.5
-                # Fashion and luxury terms
-                elif keyword.lower() in ['fashion', 'accessories', 'watches', 'timepiece', 'collection',
-                                         'launch', 'haute couture', 'limited edition']:
-                    score += 2.5
-                # Events and celebrity
-                elif keyword.lower() in ['red carpet', 'celebrity', 'auction', 'luxury']:
-                    score += 2.0
-                # Industry terms
-                elif keyword.lower() in ['collaboration', 'investment', 'trends', 'style']:
-                    score += 0.5
-                else:
-                    score += 1.0
+        for keyword in found_keywords:
+            score += self._keyword_weights[keyword]
 
         # Bonus for multiple keyword matches
         if len(found_keywords) > 2:
@@ -487,7 +1347,19 @@ class CustomArticleCollector:
         if len(found_keywords) > 4:
             score *= 1.4
 
-        return score, found_keywords
+        return score
+
+    def analyze(self, title: str, content: str) -> AnalysisResult:
+        """
+        calculate_relevance_score + is_luxury_relevant_content in one scan
+        of the lowercased title and content
+        """
+        found_keywords, has_core = self._scan_keywords(*self._lower_parts(title, content))
+        return AnalysisResult(
+            score=self._score_keywords(found_keywords),
+            keywords=found_keywords,
+            is_luxury=has_core,
+        )
 
     def try_rss_feed(self, publication: str, feed_url: str) -> List[ArticleCandidate]:
         """Try to fetch articles from a single RSS feed - NO DATE FILTER"""
@@ -498,14 +1370,14 @@ class CustomArticleCollector:
 
         try:
             # Special handling for premium/paywalled sites
-            is_premium = any(domain in feed_url for domain in ['downjones.io', 'wsj.com', 'nytimes.com'])
+            feed_host = _netloc(feed_url)
+            is_premium = any(domain in feed_host for domain in _PREMIUM_DOMAINS)
 
             if is_premium and self.scraper_type == 'curl-cffi':
                 # Use curl-cffi with special headers for premium sites
                 response = self.scraper.get(
                     feed_url,
                     timeout=15,
-                    impersonate="chrome110",
                     headers={
                         'User-Agent': self.get_random_user_agent(),
                         'Accept': 'application/rss+xml, application/xml, text/xml, */*',
@@ -513,40 +1385,45 @@ class CustomArticleCollector:
                     }
                 )
             else:
-                response = self.make_request(feed_url, timeout=10)
+                response = self.make_request(feed_url, timeout=10, use_cache=True)
 
             if response.status_code != 200:
                 return candidates
 
             # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            entries = parse_feed_entries(response.content)
 
             # Check if feed is valid
-            if not hasattr(feed, 'entries') or len(feed.entries) == 0:
+            if not entries:
                 return candidates
 
             # Process ALL entries (no limit, no date filter)
-            for entry in feed.entries:
+            usable = []
+            for entry in entries:
                 try:
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    else:
-                        pub_date = datetime.now()
-
-                    # NO DATE FILTER - Accept all articles
-
                     title = entry.get('title', '').strip()
-                    summary = entry.get('summary', '').strip()
                     url = entry.get('link', '').strip()
+                    if title and url:
+                        usable.append((entry, title, url))
+                except Exception:
+                    continue
 
-                    if not title or not url:
-                        continue
-
-                    # Score title only (quick filtering)
-                    title_score, keywords = self.calculate_title_relevance_score(title, url)
+            # Score every title of the feed in one keyword pass
+            scores = self.calculate_title_relevance_scores([(title, url) for _, title, url in usable])
 
-                    # VERY LENIENT: Accept if at least 1 keyword (score >= 1.0)
+            for (entry, title, url), (title_score, keywords) in zip(usable, scores):
+                try:
+                    # VERY LENIENT: Accept if at least 1 keyword
                     if title_score >= 1.0:
+                        # Date and summary are only needed for entries we keep
+                        # NO DATE FILTER - Accept all articles
+                        published_parsed = entry.get('published_parsed')
+                        if published_parsed:
+                            pub_date = datetime(*published_parsed[:6])
+                        else:
+                            pub_date = datetime.now()
+                        summary = entry.get('summary', '').strip()
+
                         candidate = ArticleCandidate(
                             title=title,
                             url=url,
@@ -577,9 +1454,13 @@ class CustomArticleCollector:
         successful_feeds = 0
         feed_count = len(feed_urls)
 
-        for idx, feed_url in enumerate(feed_urls, 1):
-            candidates = self.try_rss_feed(publication, feed_url)
+        if feed_count == 1:
+            results = [self.try_rss_feed(publication, feed_urls[0])]
+        else:
+            # Fetch the feeds concurrently; map() keeps them in feed order
+            results = self._fetch_map(lambda url: self.try_rss_feed(publication, url), feed_urls)
 
+        for candidates in results:
             if candidates:
                 successful_feeds += 1
                 all_candidates.extend(candidates)
@@ -596,96 +1477,108 @@ class CustomArticleCollector:
         Validation - article must contain core luxury/jewelry terms.
         No exclusion filters applied - if it has luxury keywords, we keep it.
         """
-        combined = f"{title} {content}".lower()
-
-        # Must contain at least ONE of these core luxury/jewelry terms
-        core_luxury_terms = [
-            'jewellery', 'jewelry', 'jeweler', 'jeweller',
-            'diamond', 'necklace', 'bracelet', 'earring', 'ring', 'brooch', 'pendant',
-            'cartier', 'tiffany', 'bulgari', 'chanel', 'van cleef',
-            'graff', 'harry winston', 'chopard', 'piaget', 'boucheron',
-            'gemstone', 'emerald', 'sapphire', 'ruby', 'pearl',
-            'fine jewellery', 'high jewelry', 'haute joaillerie',
-            'luxury brand', 'luxury fashion', 'luxury goods'
-        ]
-
-        has_core_term = any(term in combined for term in core_luxury_terms)
-
-        return has_core_term
+        # Title first (short, usually decides it), then the body - no combined copy
+        title_lower = title.lower()
+        if self._has_core_luxury_term(title_lower):
+            return True
+        content_lower = content.lower()
+        if self._has_core_luxury_term(content_lower):
+            return True
+        # A multi-word term could still straddle the "title content" join
+        return self._has_core_luxury_term(self._seam(title_lower, content_lower))
+
+    def _seam(self, title_lower: str, content_lower: str) -> str:
+        """The stretch around the title/content join where a match can span both"""
+        n = self._max_term_len - 1
+        return f"{title_lower[-n:]} {content_lower[:n]}"
+
+    def _has_core_luxury_term(self, text_lower: str) -> bool:
+        """Must contain at least ONE core luxury/jewelry term"""
+        if self._keyword_automaton is None:
+            return any(term in text_lower for term in CORE_LUXURY_TERMS)
+
+        # Stops at the first core term instead of scanning for all of them
+        return any(is_core for _, (_, is_core) in self._keyword_automaton.iter(text_lower))
 
     def is_relevant_url(self, url: str) -> bool:
         """Enhanced URL filtering - must contain luxury/jewelry keywords"""
+        return self._relevant_url_cached(url)
+
+    def _check_relevant_url(self, url: str) -> bool:
+        """Uncached body of is_relevant_url (memoized per instance in __init__)"""
         url_lower = url.lower()
 
         # Explicitly exclude National Jeweler category/section pages
-        national_jeweler_excluded = [
-            'https://nationaljeweler.com/',
-            'https://nationaljeweler.com/industry',
-            'https://nationaljeweler.com/industry/industry-other',
-            'https://nationaljeweler.com/industry/independents',
-            'https://nationaljeweler.com/industry/events-awards',
-            'https://nationaljeweler.com/industry/financials',
-            'https://nationaljeweler.com/industry/supplier-bulletin',
-            'https://nationaljeweler.com/industry/technology',
-            'https://nationaljeweler.com/industry/surveys',
-            'https://nationaljeweler.com/industry/policies-issues',
-            'https://nationaljeweler.com/industry/crime',
-            'https://nationaljeweler.com/industry/majors',
-            'https://nationaljeweler.com/diamonds-gems',
-            'https://nationaljeweler.com/diamonds-gems/diamonds-gems-other',
-            'https://nationaljeweler.com/diamonds-gems/lab-grown',
-            'https://nationaljeweler.com/diamonds-gems/grading',
-            'https://nationaljeweler.com/diamonds-gems/sourcing',
-            'https://nationaljeweler.com/style',
-            'https://nationaljeweler.com/style/style-other',
-            'https://nationaljeweler.com/style/trends',
-            'https://nationaljeweler.com/style/auctions',
-            'https://nationaljeweler.com/style/watches',
-            'https://nationaljeweler.com/style/collections',
-            'https://nationaljeweler.com/opinions',
-            'https://nationaljeweler.com/opinions/editors',
-            'https://nationaljeweler.com/opinions/columnists'
-        ]
-
         url_clean = url.rstrip('/')
-        if url_clean in national_jeweler_excluded or url in national_jeweler_excluded:
+        if url_clean in self._NATIONAL_JEWELER_EXCLUDED or url in self._NATIONAL_JEWELER_EXCLUDED:
             return False
 
         # Simple check: URL must contain at least ONE luxury keyword
-        has_core_keyword = any(keyword.lower() in url_lower for keyword in self.luxury_keywords)
+        has_core_keyword = self._has_keyword(url_lower)
 
         return has_core_keyword
 
     def fetch_urls_from_sitemap(self, sitemap_url: str) -> List[tuple]:
         """Fetch ALL URLs from sitemap recursively"""
-        urls = []
+        return [(url, _parse_lastmod(lastmod)) for url, lastmod in self._fetch_sitemap_locs(sitemap_url)]
+
+    def _fetch_sitemap_locs(self, sitemap_url: str) -> List[tuple]:
+        """fetch_urls_from_sitemap with the lastmod left as raw text (parsed only if needed)"""
         try:
-            response = self.make_request(sitemap_url, timeout=10)
+            response = self.make_request(sitemap_url, timeout=10, max_bytes=SITEMAP_MAX_BYTES, use_cache=True)
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-
-                    if loc_elem is not None:
-                        url = loc_elem.text
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-
-                        urls.append((url, lastmod_date))
+                return [
+                    (url, lastmod)
+                    for _, url, lastmod in self._parse_sitemap_cached(sitemap_url, response.content) or []
+                ]
         except:
             pass
 
+        return []
+
+    def _parse_sitemap_cached(self, url: str, content: bytes) -> Optional[List[tuple]]:
+        """
+        parse_sitemap, memoized in the HTTP cache by URL + body digest - a
+        sitemap that came back 304 (or byte-identical) skips the XML parse
+        """
+        if self.http_cache is None:
+            return parse_sitemap(content)
+
+        digest = hashlib.sha1(content).hexdigest()
+        try:
+            entries = self.http_cache.get_entries(url, digest)
+            if entries is not None:
+                return entries
+        except (sqlite3.Error, ValueError):
+            pass
+
+        entries = parse_sitemap(content)
+        if entries is not None:
+            try:
+                self.http_cache.put_entries(url, digest, entries)
+            except sqlite3.Error:
+                pass
+        return entries
+
+    def _expand_sitemap_entries(self, entries: List[tuple]) -> List[tuple]:
+        """
+        parse_sitemap entries -> [(url, lastmod text)] in document order.
+        Sub-sitemaps of an index are fetched concurrently, each one once.
+        """
+        sub_sitemaps = list(dict.fromkeys(loc for kind, loc, _ in entries if kind == 'sitemap'))
+        fetched = {}
+        if len(sub_sitemaps) == 1:
+            fetched[sub_sitemaps[0]] = self._fetch_sitemap_locs(sub_sitemaps[0])
+        elif sub_sitemaps:
+            fetched = dict(zip(sub_sitemaps, self._fetch_map(self._fetch_sitemap_locs, sub_sitemaps)))
+
+        urls = []
+        for kind, loc, lastmod in entries:
+            if kind == 'sitemap':
+                # pop() so an index listing the same sub-sitemap twice contributes it once
+                urls.extend(fetched.pop(loc, ()))
+            else:
+                urls.append((loc, lastmod))
         return urls
 
     def fetch_sitemap_articles(self, publication: str, sitemap_url: str) -> List[ArticleCandidate]:
@@ -693,98 +1586,33 @@ class CustomArticleCollector:
         candidates = []
 
         try:
-            response = self.make_request(sitemap_url, timeout=15)
+            response = self.make_request(sitemap_url, timeout=15, max_bytes=SITEMAP_MAX_BYTES, use_cache=True)
 
             if response.status_code != 200:
                 return candidates
 
-            # Try multiple decoding strategies for problematic sitemaps
-            xml_content = None
-
-            # Strategy 1: Use response.text (auto-decodes)
-            try:
-                xml_content = response.text
-                root = ET.fromstring(xml_content)
-            except (ET.ParseError, UnicodeDecodeError):
-                xml_content = None
+            # Streamed parse with decoding fallbacks for problematic sitemaps
+            entries = self._parse_sitemap_cached(sitemap_url, response.content)
 
-            # Strategy 2: Try raw content with UTF-8
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-
-            # Strategy 3: Try raw content with ISO-8859-1
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('iso-8859-1')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-
-            # Strategy 4: Try decompressing manually then parsing
-            if xml_content is None:
-                try:
-                    import gzip
-                    decompressed = gzip.decompress(response.content)
-                    xml_content = decompressed.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except:
-                    xml_content = None
-
-            # If all strategies failed
-            if xml_content is None:
+            if entries is None:
                 print(f"  Sitemap error: Cannot parse XML")
                 return candidates
 
-            urls = []
-
-            if 'sitemapindex' in root.tag:
-                # Check ALL sub-sitemaps (no limit)
-                for sitemap in root:
-                    loc_elem = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        sub_sitemap_url = loc_elem.text
-                        urls.extend(self.fetch_urls_from_sitemap(sub_sitemap_url))
-
-            elif 'urlset' in root.tag:
-                # Process ALL URLs in sitemap (no limit)
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-
-                    if loc_elem is not None:
-                        url = loc_elem.text
-
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                                # NO DATE FILTER
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-
-                        urls.append((url, lastmod_date))
+            # Check ALL sub-sitemaps and ALL URLs (no limit, NO DATE FILTER)
+            urls = self._expand_sitemap_entries(entries)
 
             print(f"  Found {len(urls)} total URLs in sitemap")
 
-            # Filter by URL relevance only (fast, no downloads needed)
-            for url, pub_date in urls:
+            # Filter by URL relevance only (fast, no downloads needed); the
+            # lastmod date is parsed only for URLs that pass
+            for url, lastmod in urls:
                 try:
                     if self.is_relevant_url(url):
                         candidate = ArticleCandidate(
                             title="",  # Will be filled when we download full content
                             url=url,
                             publication=publication,
-                            published_date=pub_date,
+                            published_date=_parse_lastmod(lastmod),
                             summary="",
                             relevance_score=0.0,  # Will be scored later on full content
                             keywords_found=[]
@@ -849,15 +1677,13 @@ class CustomArticleCollector:
                 else:
                     print(f"  RSS error: {error_msg[:100]}")
 
-        # Remove duplicates
-        unique_candidates = []
-        seen_urls = set()
+        # Remove duplicates (sitemap and RSS often list the same article,
+        # with or without a trailing slash) - first occurrence wins
+        unique_candidates = {}
         for candidate in all_candidates:
-            if candidate.url not in seen_urls:
-                unique_candidates.append(candidate)
-                seen_urls.add(candidate.url)
+            unique_candidates.setdefault(_canonical_url(candidate.url), candidate)
 
-        return unique_candidates
+        return list(unique_candidates.values())
 
     def search_url_in_sitemap(self, publication: str, search_url: str) -> dict:
         """Search for a specific URL in a publication's sitemap"""
@@ -874,59 +1700,28 @@ class CustomArticleCollector:
             print(f"\nSearching for URL in {publication} sitemap...")
             print(f"Target URL: {search_url}\n")
 
-            response = self.make_request(sitemap_url, timeout=15)
+            response = self.make_request(sitemap_url, timeout=15, max_bytes=SITEMAP_MAX_BYTES, use_cache=True)
 
             if response.status_code != 200:
                 return {'found': False, 'error': f'Failed to fetch sitemap (HTTP {response.status_code})'}
 
-            # Try multiple decoding strategies
-            xml_content = None
-            try:
-                xml_content = response.text
-                root = ET.fromstring(xml_content)
-            except (ET.ParseError, UnicodeDecodeError):
-                pass
+            # Streamed parse with decoding fallbacks for problematic sitemaps
+            entries = self._parse_sitemap_cached(sitemap_url, response.content)
+            if entries is None:
+                return {'found': False, 'error': 'Could not parse sitemap XML'}
 
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    pass
-
-            if xml_content is None:
-                try:
-                    import gzip
-                    decompressed = gzip.decompress(response.content)
-                    xml_content = decompressed.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except:
-                    return {'found': False, 'error': 'Could not parse sitemap XML'}
-
-            all_urls = []
-
-            # Handle sitemap index
-            if 'sitemapindex' in root.tag:
-                for sitemap in root:
-                    loc_elem = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        sub_sitemap_url = loc_elem.text
-                        all_urls.extend(self.fetch_urls_from_sitemap(sub_sitemap_url))
-
-            # Handle regular sitemap
-            elif 'urlset' in root.tag:
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        all_urls.append((loc_elem.text, datetime.now()))
+            # Sitemap index: pulls in every sub-sitemap
+            all_urls = self._expand_sitemap_entries(entries)
 
             print(f"Total URLs found in sitemap: {len(all_urls)}\n")
 
-            # Search for the URL
+            # Search for the URL (trailing slashes ignored). startswith() rejects
+            # almost every entry without allocating; only prefix hits get rstrip'd
+            target = search_url.rstrip('/')
             found_url = None
             is_relevant = False
-            for url, pub_date in all_urls:
-                if url == search_url or search_url.rstrip('/') == url.rstrip('/'):
+            for url, _ in all_urls:
+                if url.startswith(target) and url.rstrip('/') == target:
                     found_url = url
                     is_relevant = self.is_relevant_url(url)
                     break
@@ -973,55 +1768,74 @@ class CustomArticleCollector:
     def extract_title_from_page(self, url: str) -> Optional[str]:
         """Quickly extract just the title from a page (without full parsing)"""
         try:
-            response = self.make_request(url, timeout=10)
+            # <title> sits in <head>: stop downloading once it has been read
+            response = self.make_request(url, timeout=10, max_bytes=TITLE_SCAN_BYTES, stop_at=b'</title>')
             if response.status_code != 200:
                 return None
 
-            # Quick regex to extract title
-            title_match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
-            if title_match:
-                return title_match.group(1).strip()
+            # Plain byte search on the (small) prefix - no full decode, no regex
+            head = response.content.lower()
+            start = head.find(b'<title')
+            if start == -1:
+                return None
+            start = head.find(b'>', start) + 1
+            end = head.find(b'<', start)
+            if start == 0 or end <= start or not head.startswith(b'</title>', end):
+                return None
 
-            return None
+            return _decode_page_text(
+                response.content[start:end], response.headers.get('Content-Type'), head
+            ).strip()
         except:
             return None
 
     def extract_full_content(self, candidate: ArticleCandidate) -> ArticleCandidate:
         """Extract full content and calculate final relevance score"""
         try:
-            # Download HTML using curl-cffi
-            response = self.make_request(candidate.url, timeout=20)
+            # Pages extracted within the last day are re-scored without downloading
+            cached = self.http_cache.get_article(candidate.url) if self.http_cache else None
 
-            if response.status_code != 200:
-                return None
+            if cached is None:
+                # Download HTML using curl-cffi
+                response = self.make_request(candidate.url, timeout=20)
 
-            # Use newspaper to parse the HTML
-            article = Article(candidate.url)
-            article.download_state = 2
-            article.html = response.text
-            article.parse()
+                if response.status_code != 200:
+                    return None
 
-            if not article.text or len(article.text) < 150:
-                return None
+                # lxml fast path; full newspaper parse only if it finds too little text
+                article = parse_article(candidate.url, response.text, min_text=150)
+
+                if not article.text or len(article.text) < 150:
+                    return None
+
+                cached = {
+                    'title': article.title,
+                    'text': article.text,
+                    'author': self.extract_author(article, article.text),
+                    'meta_description': article.meta_description,
+                }
+                if self.http_cache:
+                    self.http_cache.put_article(candidate.url, cached)
 
-            candidate.full_content = article.text
+            text = cached['text']
+            candidate.full_content = text
 
-            if not candidate.title and article.title:
-                candidate.title = article.title
+            if not candidate.title and cached['title']:
+                candidate.title = cached['title']
 
             # Calculate relevance score based on full content
             full_score, full_keywords = self.calculate_relevance_score(
-                candidate.title or "", article.text
+                candidate.title or "", text
             )
 
             candidate.relevance_score = full_score
             candidate.keywords_found = full_keywords
 
-            # Extract author
-            candidate.author = self.extract_author(article, article.text)
+            candidate.author = cached['author']
 
-            if article.meta_description and len(article.meta_description) > len(candidate.summary):
-                candidate.summary = article.meta_description
+            meta_description = cached['meta_description']
+            if meta_description and len(meta_description) > len(candidate.summary):
+                candidate.summary = meta_description
 
             # Return article with score (no threshold)
             return candidate
@@ -1042,6 +1856,163 @@ class CustomArticleCollector:
                 print(f"  Error: {error_msg[:60]} - {candidate.publication}")
             return None
 
+    def _collect_stage1(self, publications: List[str]) -> Dict[str, tuple]:
+        """
+        Run collect_from_source for all publications in a thread pool.
+        Returns publication -> (candidates, the log output it printed)
+        """
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=STAGE1_WORKERS) as executor:
+                results = executor.map(
+                    lambda pub: stdout.run_captured(self.collect_from_source, pub, self.target_sources[pub]),
+                    publications
+                )
+                return dict(zip(publications, results))
+        finally:
+            sys.stdout = stdout._stream
+
+    def _download_lane(self, stdout: _ThreadBufferedStdout, candidates: List[ArticleCandidate],
+                       lane: int, strong: list) -> tuple:
+        """
+        Download every STAGE2_PER_PUBLICATION-th candidate starting at lane,
+        one at a time -> ([(index, enhanced candidate or None, log output)], stopped early).
+        strong is shared by the publication's lanes; they all stop once it
+        holds STAGE2_STRONG_COUNT strong articles.
+        """
+        results = []
+        for idx in range(lane, len(candidates), STAGE2_PER_PUBLICATION):
+            if len(strong) >= STAGE2_STRONG_COUNT:
+                return results, True
+            enhanced, output = stdout.run_captured(self.extract_full_content, candidates[idx])
+            results.append((idx, enhanced, output))
+            if enhanced and enhanced.relevance_score >= STAGE2_STRONG_SCORE:
+                strong.append(idx)  # list.append is atomic - no lock needed
+        return results, False
+
+    def _stage2_prior(self, candidate: ArticleCandidate) -> float:
+        """Cheap pre-download estimate: keyword score of the URL slug plus any title score"""
+        return self._score_keywords(self._find_keywords(candidate.url.lower())) + candidate.relevance_score
+
+    def _collect_stage2(self, stage1_results: Dict[str, tuple]) -> Dict[str, tuple]:
+        """
+        Download and score the Stage 1 candidates of all publications in a
+        thread pool. Each publication gets STAGE2_PER_PUBLICATION lanes that
+        work through its candidates sequentially, so no site ever sees more
+        than that many concurrent requests from us.
+        Returns publication -> ([(enhanced candidate or None, log output)] in
+        candidate order, whether the lanes stopped early on strong articles)
+        """
+        # Likely matches go first, so the early stop usually comes after a few downloads.
+        # An article syndicated to several publications is downloaded once,
+        # for the first publication (in collection order) that lists it
+        claimed = set()
+        to_download = {}
+        for publication, (candidates, _) in stage1_results.items():
+            fresh = []
+            for candidate in sorted(candidates, key=self._stage2_prior, reverse=True):
+                if len(fresh) == STAGE2_MAX_DOWNLOADS:
+                    break
+                key = _url_fingerprint(candidate.url)
+                if key not in claimed:
+                    claimed.add(key)
+                    fresh.append(candidate)
+            if fresh:
+                to_download[publication] = fresh
+
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=STAGE2_WORKERS) as executor:
+                lanes = {}
+                for publication, candidates in to_download.items():
+                    strong = []
+                    lanes[publication] = [
+                        executor.submit(self._download_lane, stdout, candidates, lane, strong)
+                        for lane in range(STAGE2_PER_PUBLICATION)
+                    ]
+
+                results = {}
+                for publication, futures in lanes.items():
+                    lane_results = [future.result() for future in futures]
+                    merged = sorted(
+                        (item for items, _ in lane_results for item in items),
+                        key=lambda item: item[0]
+                    )
+                    stopped_early = any(stopped for _, stopped in lane_results)
+                    results[publication] = ([(enhanced, output) for _, enhanced, output in merged], stopped_early)
+                return results
+        finally:
+            sys.stdout = stdout._stream
+
+    def _report_publication(self, publication: str, stage1_result: tuple,
+                            stage2_result: tuple) -> List[ArticleCandidate]:
+        """
+        Print one publication's Stage 1-3 report from the already collected
+        results and return its top 3 articles
+        """
+        print(f"{publication}:")
+        self.requests_per_source = 0
+
+        # STAGE 1: Collect ALL candidates from sitemap/RSS (already fetched concurrently)
+        candidates, stage1_output = stage1_result
+        if not QUIET_WORKERS:
+            sys.stdout.write(stage1_output)
+
+        if not candidates:
+            print(f"  No candidates found\n")
+            return []
+
+        print(f"  Stage 1: Collected {len(candidates)} relevant URL candidates")
+
+        # STAGE 2: Download full content and score relevance (already done concurrently)
+        print(f"  Stage 2: Downloading and scoring full content...")
+        publication_articles = []
+        downloads, stopped_early = stage2_result
+
+        for enhanced, stage2_output in downloads:
+            if not QUIET_WORKERS:
+                sys.stdout.write(stage2_output)
+            if enhanced:
+                publication_articles.append(enhanced)
+                if len(publication_articles) % 5 == 0:
+                    print(f"           Found {len(publication_articles)} relevant articles so far...")
+
+        if stopped_early:
+            strong_count = sum(1 for article in publication_articles if article.relevance_score >= STAGE2_STRONG_SCORE)
+            print(f"           Stopped after {len(downloads)} downloads: {strong_count} articles scored >= {STAGE2_STRONG_SCORE:.0f}")
+        # Safety: at most 100 downloads per publication
+        elif len(candidates) >= STAGE2_MAX_DOWNLOADS:
+            print(f"           Reached {STAGE2_MAX_DOWNLOADS} download limit, proceeding to final selection...")
+
+        # STAGE 3: Sort by relevance score and select top 3
+        publication_articles.sort(key=lambda x: x.relevance_score, reverse=True)
+
+        # List ALL articles that passed the threshold
+        if publication_articles:
+            print(f"  Stage 3: Found {len(publication_articles)} articles with content score > 3.0")
+            print(f"\n  === ALL ARTICLES WITH SCORE > 3.0 ===")
+            for idx, article in enumerate(publication_articles, 1):
+                print(f"  {idx}. [{article.relevance_score:.1f}] {article.title[:70]}...")
+                print(f"     Author: {article.author} | Date: {article.published_date.strftime('%Y-%m-%d')}")
+                print(f"     Keywords: {', '.join(article.keywords_found[:5])}{'...' if len(article.keywords_found) > 5 else ''}")
+            print(f"  {'='*70}")
+
+        # Select top 3 by highest score
+        final_3 = publication_articles[:3]
+
+        if final_3:
+            print(f"\n  ✅ Final Selection: Top {len(final_3)} article(s) by relevance score")
+            for idx, article in enumerate(final_3, 1):
+                print(f"     {idx}. [{article.relevance_score:.1f}] {article.title[:60]}...")
+                print(f"        {article.author} | {article.published_date.strftime('%Y-%m-%d')}")
+            print()
+        else:
+            print(f"  ❌ Collected: 0 articles (none scored > 3.0)\n")
+
+        return final_3
+
     def collect_top_3_per_publication(self, sources_subset: List[str] = None) -> List[ArticleCandidate]:
         """
         SMART COLLECTION PROCESS:
@@ -1060,74 +2031,22 @@ class CustomArticleCollector:
 
         all_articles = []
 
-        for publication in sources_to_use:
-            if publication not in self.target_sources:
-                continue
-
-            print(f"{publication}:")
-            self.requests_per_source = 0
-            source_info = self.target_sources[publication]
-
-            # STAGE 1: Collect ALL candidates from sitemap/RSS
-            candidates = self.collect_from_source(publication, source_info)
-
-            if not candidates:
-                print(f"  No candidates found\n")
-                time.sleep(random.uniform(3, 6))
-                continue
+        publications = [p for p in sources_to_use if p in self.target_sources]
+        stage1_results = self._collect_stage1(publications)
+        stage2_results = self._collect_stage2(stage1_results)
 
-            print(f"  Stage 1: Collected {len(candidates)} relevant URL candidates")
-
-            # STAGE 2: Download full content and score relevance
-            print(f"  Stage 2: Downloading and scoring full content...")
-            publication_articles = []
-
-            # Download up to 100 candidates (safety limit)
-            max_downloads = min(len(candidates), 100)
-
-            for idx, candidate in enumerate(candidates[:max_downloads]):
-                enhanced = self.extract_full_content(candidate)
-                if enhanced:
-                    publication_articles.append(enhanced)
-                    if len(publication_articles) % 5 == 0:
-                        print(f"           Found {len(publication_articles)} relevant articles so far...")
-
-                time.sleep(random.uniform(1, 2))
-
-                # Safety: stop after 100 downloads
-                if idx >= 99:
-                    print(f"           Reached 100 download limit, proceeding to final selection...")
-                    break
-
-            # STAGE 3: Sort by relevance score and select top 3
-            publication_articles.sort(key=lambda x: x.relevance_score, reverse=True)
-
-            # List ALL articles that passed the threshold
-            if publication_articles:
-                print(f"  Stage 3: Found {len(publication_articles)} articles with content score > 3.0")
-                print(f"\n  === ALL ARTICLES WITH SCORE > 3.0 ===")
-                for idx, article in enumerate(publication_articles, 1):
-                    print(f"  {idx}. [{article.relevance_score:.1f}] {article.title[:70]}...")
-                    print(f"     Author: {article.author} | Date: {article.published_date.strftime('%Y-%m-%d')}")
-                    print(f"     Keywords: {', '.join(article.keywords_found[:5])}{'...' if len(article.keywords_found) > 5 else ''}")
-                print(f"  {'='*70}")
-
-            # Select top 3 by highest score
-            final_3 = publication_articles[:3]
-
-            if final_3:
-                print(f"\n  ✅ Final Selection: Top {len(final_3)} article(s) by relevance score")
-                for idx, article in enumerate(final_3, 1):
-                    print(f"     {idx}. [{article.relevance_score:.1f}] {article.title[:60]}...")
-                    print(f"        {article.author} | {article.published_date.strftime('%Y-%m-%d')}")
-                print()
-            else:
-                print(f"  ❌ Collected: 0 articles (none scored > 3.0)\n")
+        for publication in publications:
+            # Each publication's report is assembled in memory and written with one flush
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                final_3 = self._report_publication(
+                    publication, stage1_results[publication], stage2_results.get(publication, ([], False))
+                )
+            sys.stdout.write(report.getvalue())
+            sys.stdout.flush()
 
             all_articles.extend(final_3)
 
-            time.sleep(random.uniform(3, 6))
-
         print("=" * 70)
         print(f"Collection complete: {len(all_articles)} total articles")
         print(f"Publications covered: {len(set(a.publication for a in all_articles))}/{len(sources_to_use)}")
@@ -1174,24 +2093,38 @@ class CustomArticleCollector:
 
         return "\n".join(report)
 
-    def save_results(self, articles: List[ArticleCandidate], filename: str = "collected_articles.json"):
-        data = []
-        for article in articles:
-            data.append({
-                'title': article.title,
-                'url': article.url,
-                'publication': article.publication,
-                'author': article.author,
-                'published_date': article.published_date.isoformat(),
-                'summary': article.summary,
-                'full_content': article.full_content,
-                'relevance_score': article.relevance_score,
-                'keywords_found': article.keywords_found,
-                'content_length': len(article.full_content)
-            })
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def save_results(self, articles: List[ArticleCandidate], filename: Optional[str] = None, pretty: bool = False):
+        """Write articles as NDJSON (one object per line), or an indented JSON list when pretty=True"""
+        if filename is None:
+            filename = "collected_articles.json" if pretty else "collected_articles.jsonl"
+
+        def records():
+            for article in articles:
+                yield {
+                    'title': article.title,
+                    'url': article.url,
+                    'publication': article.publication,
+                    'author': article.author,
+                    'published_date': article.published_date.isoformat(),
+                    'summary': article.summary,
+                    'full_content': article.full_content,
+                    'relevance_score': article.relevance_score,
+                    'keywords_found': article.keywords_found,
+                    'content_length': len(article.full_content)
+                }
+
+        if pretty:
+            write_json(filename, list(records()))
+        elif ORJSON_AVAILABLE:
+            # Stream one line per article so no full list is held in memory
+            with open(filename, 'wb') as f:
+                for record in records():
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                for record in records():
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+                    f.write('\n')
 
         return filename
 